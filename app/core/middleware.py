@@ -0,0 +1,15 @@
+from fastapi.middleware.gzip import GZipMiddleware
+
+class JSONGZipMiddleware:
+    """GZip responses except paths that serve already-compressed images"""
+
+    def __init__(self, app, minimum_size: int = 512, skip_prefixes: tuple = ()):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.skip_prefixes = tuple(skip_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith(self.skip_prefixes):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
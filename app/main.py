@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 import os
@@ -8,6 +9,7 @@ from dotenv import load_dotenv
 from .routers import generate, health, storage
 from .core.config import settings
 from .core.logging import setup_logging
+from .core.middleware import JSONGZipMiddleware
 
 # Load environment variables
 load_dotenv()
@@ -21,7 +23,8 @@ app = FastAPI(
     description="Generate cover images for crypto news articles using Stable Diffusion XL + LoRA",
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None
+    redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -33,6 +36,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON; preview images are already compressed
+app.add_middleware(JSONGZipMiddleware, minimum_size=512, skip_prefixes=("/temp",))
+
 # Include routers
 app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(generate.router, prefix="/api/generate", tags=["generation"])
@@ -91,5 +97,8 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
+        workers=1,  # SDXL pipeline is held in-process; never load it per worker
+        loop="uvloop",
+        http="httptools",
         log_level="info" if settings.DEBUG else "warning"
     )
\ No newline at end of file
@@ -1,8 +1,12 @@
 from fastapi import APIRouter
+from fastapi.responses import Response
 from pydantic import BaseModel
+import orjson
 
 router = APIRouter()
 
+_HEALTH = orjson.dumps({"status": "healthy", "version": "1.0.0"})
+
 class HealthResponse(BaseModel):
     status: str
     version: str
@@ -10,7 +14,7 @@ class HealthResponse(BaseModel):
 @router.get("/")
 async def health_check():
     """Ultra-minimal health check - guaranteed to work"""
-    return {"status": "healthy", "version": "1.0.0"}
+    return Response(content=_HEALTH, media_type="application/json")
 
 @router.get("/detailed")
 async def detailed_health():
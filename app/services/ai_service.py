@@ -34,11 +34,17 @@ class AIService:
             # Create cache directory if it doesn't exist
             os.makedirs(settings.MODEL_CACHE_DIR, exist_ok=True)
             
-            self.pipeline = StableDiffusionXLPipeline.from_pretrained(
-                model_id,
-                torch_dtype=torch.float16 if self.device == "mps" else torch.float32,
-                cache_dir=settings.MODEL_CACHE_DIR,
-                use_safetensors=True
+            # Load weights in a worker thread so the LoRA scan (and any other
+            # coroutines on the loop) run while they stream in
+            self.pipeline, _ = await asyncio.gather(
+                asyncio.to_thread(
+                    StableDiffusionXLPipeline.from_pretrained,
+                    model_id,
+                    torch_dtype=torch.float16 if self.device == "mps" else torch.float32,
+                    cache_dir=settings.MODEL_CACHE_DIR,
+                    use_safetensors=True
+                ),
+                self._load_lora_models()
             )
             
             # Use DPM++ scheduler for better quality
@@ -59,9 +65,6 @@ class AIService:
                 text_encoder=self.pipeline.text_encoder
             )
             
-            # Load available LoRA models
-            await self._load_lora_models()
-            
             self.initialized = True
             logger.info(f"✅ SDXL pipeline initialized on device: {self.device}")
             
@@ -76,18 +76,17 @@ class MockAIService:
                     colors = client_color
                     break
             
-            # Create gradient background
-            image = Image.new('RGB', (width, height))
-            draw = ImageDraw.Draw(image)
-            
+            # Create gradient background: one 1-pixel-wide column, stretched across the width
+            ramp = []
             for y in range(height):
                 # Linear gradient from top to bottom
                 ratio = y / height
-                r = int(colors[0][0] * (1 - ratio) + colors[1][0] * ratio)
-                g = int(colors[0][1] * (1 - ratio) + colors[1][1] * ratio)
-                b = int(colors[0][2] * (1 - ratio) + colors[1][2] * ratio)
-                
-                draw.rectangle([(0, y), (width, y + 1)], fill=(r, g, b))
+                ramp.append(tuple(int(top * (1 - ratio) + bottom * ratio) for top, bottom in zip(colors[0], colors[1])))
+            
+            column = Image.new('RGB', (1, height))
+            column.putdata(ramp)
+            image = column.resize((width, height), Image.Resampling.NEAREST)
+            draw = ImageDraw.Draw(image)
             
             # Add some geometric elements for crypto feel
             self._add_crypto_elements(draw, width, height, colors[1])
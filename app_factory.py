@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+AI Cover Generator - Shared FastAPI application factory
+One app for every Railway entrypoint; COVER_MODE selects the generator backend:
+  mock        placeholder image URLs, no generation
+  subprocess  runs simple_generator.py per request
+  inproc      keeps ProductionCoverGenerator (SDXL) loaded in-process
+"""
+
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+from urllib.parse import quote_plus
+import asyncio
+import io
+import logging
+import os
+import sys
+import time
+import uuid
+import orjson
+
+from app.core.middleware import JSONGZipMiddleware
+from schemas import GenerateRequest, GenerateResponse
+
+logger = logging.getLogger(__name__)
+
+CoverMode = Literal["mock", "subprocess", "inproc"]
+
+PLACEHOLDER_PREFIX = "https://via.placeholder.com/1800x900/4A90E2/FFFFFF?text="
+
+SUPPORTED_CLIENTS = [
+    "hedera", "algorand", "constellation",
+    "bitcoin", "ethereum", "generic"
+]
+
+SERVICE_NAMES = {
+    "mock": "AI Cover Generator",
+    "subprocess": "LoRA AI Cover Generator",
+    "inproc": "LoRA AI Cover Generator"
+}
+
+@dataclass(frozen=True)
+class ServiceSettings:
+    port: int
+    output_dir: Path
+    generator_script: Path
+    generation_timeout: int
+
+@lru_cache(maxsize=1)
+def get_settings() -> ServiceSettings:
+    """Read service settings from the environment once"""
+    return ServiceSettings(
+        port=int(os.environ.get("PORT", 8000)),
+        output_dir=Path(os.environ.get("COVER_OUTPUT_DIR", "style_outputs")),
+        generator_script=Path(os.environ.get("COVER_GENERATOR_SCRIPT", "simple_generator.py")),
+        generation_timeout=int(os.environ.get("COVER_GENERATION_TIMEOUT", 300))
+    )
+
+def _encode_png(image, palette: bool = False) -> bytes:
+    """Encode a PIL image as PNG, optionally quantized to a 256-colour palette"""
+    from PIL import Image
+    if palette:
+        try:
+            image = image.quantize(colors=256, method=Image.Quantize.LIBIMAGEQUANT)
+        except ValueError:
+            # Pillow built without libimagequant
+            image = image.quantize(colors=256)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def _requantize_png(png: bytes) -> bytes:
+    """Palette-quantize already encoded PNG bytes"""
+    from PIL import Image
+    with Image.open(io.BytesIO(png)) as image:
+        return _encode_png(image.convert("RGB"), palette=True)
+
+@asynccontextmanager
+async def _inproc_lifespan(app: FastAPI):
+    """Load SDXL, watermark and fonts before Uvicorn starts accepting connections"""
+    from production_cover_generator import ProductionCoverGenerator
+    logger.info("🧠 Loading ProductionCoverGenerator...")
+    app.state.generator = await asyncio.to_thread(ProductionCoverGenerator)
+    logger.info("✅ Generator ready")
+    yield
+
+def create_app(mode: CoverMode = "mock") -> FastAPI:
+    """Build the cover generator API for the given backend mode"""
+    if mode not in SERVICE_NAMES:
+        raise ValueError(f"Unknown COVER_MODE: {mode!r} (expected one of {', '.join(SERVICE_NAMES)})")
+
+    settings = get_settings()
+    service_name = SERVICE_NAMES[mode]
+
+    app = FastAPI(
+        title=service_name,
+        description="Generate cryptocurrency news covers with client-specific branding",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=_inproc_lifespan if mode == "inproc" else None
+    )
+
+    # Enable CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Compress JSON; PNG responses are already compressed
+    app.add_middleware(
+        JSONGZipMiddleware,
+        minimum_size=512,
+        skip_prefixes=("/images", "/generate/image")
+    )
+
+    endpoints = {
+        "health": "/health",
+        "status": "/status",
+        "generate": "/generate"
+    }
+    if mode != "mock":
+        endpoints["generate_image"] = "/generate/image"
+        endpoints["images"] = "/images/{filename}"
+        endpoints["docs"] = "/docs"
+
+    # Static payloads, serialized once at app creation
+    root_payload = orjson.dumps({
+        "service": service_name,
+        "status": "running",
+        "version": "1.0.0",
+        "mode": mode,
+        "endpoints": endpoints
+    })
+    health_payload = orjson.dumps({
+        "status": "healthy",
+        "service": service_name,
+        "version": "1.0.0"
+    })
+
+    @app.get("/")
+    async def root():
+        """Root endpoint with service info"""
+        return Response(content=root_payload, media_type="application/json")
+
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint"""
+        return Response(content=health_payload, media_type="application/json")
+
+    if mode == "mock":
+        _add_mock_routes(app, service_name)
+    else:
+        settings.output_dir.mkdir(exist_ok=True)
+        # Mount static files AFTER creating directory
+        app.mount("/images", StaticFiles(directory=str(settings.output_dir)), name="images")
+
+        if mode == "subprocess":
+            _add_subprocess_routes(app, service_name, settings)
+        else:
+            _add_inproc_routes(app, service_name, settings)
+
+    logger.info(f"✅ {service_name} app created in {mode} mode")
+    return app
+
+def _add_mock_routes(app: FastAPI, service_name: str):
+    """Placeholder generation - no ML dependencies"""
+    status_payload = orjson.dumps({
+        "available": True,
+        "service": service_name,
+        "python_version": sys.version,
+        "supported_clients": SUPPORTED_CLIENTS
+    })
+
+    @app.get("/status")
+    async def service_status():
+        """Get service status"""
+        return Response(content=status_payload, media_type="application/json")
+
+    @app.post("/generate")
+    async def generate_cover(request: GenerateRequest):
+        """Generate a placeholder cover image"""
+        logger.info(f"🎨 Generate endpoint accessed for: {request.title}")
+        return {
+            "success": True,
+            "image_url": PLACEHOLDER_PREFIX + quote_plus(request.title),
+            "error": None
+        }
+
+def _add_subprocess_routes(app: FastAPI, service_name: str, settings: ServiceSettings):
+    """Generation via simple_generator.py in a child process"""
+    output_dir = settings.output_dir
+    generator_path = settings.generator_script
+
+    # Subprocess environment, computed once at startup
+    subproc_env = os.environ.copy()
+    if "OPENAI_API_KEY" in subproc_env:
+        logger.info("✅ OpenAI API key found")
+    else:
+        logger.warning("⚠️ OpenAI API key not found")
+
+    async def run_generator(request: GenerateRequest, output: str):
+        """Run the generation script; returns (returncode, stdout bytes, stderr, seconds)"""
+        # Article content is piped to the generator via stdin
+        article_input = None
+        if request.article_content:
+            article_input = f"{request.title}\n\n{request.article_content}".encode("utf-8")
+
+        # Use simple generator
+        cmd_args = [
+            sys.executable,
+            str(generator_path),
+            "--title", request.title,
+            "--client", request.client_id or "generic",
+            "--output", output
+        ]
+
+        # Add subtitle if provided
+        if request.subtitle:
+            cmd_args.extend(["--subtitle", request.subtitle])
+
+        # Read article from stdin if provided
+        if article_input:
+            cmd_args.extend(["--article", "-"])
+
+        logger.info(f"🚀 Executing: {' '.join(cmd_args)}")
+
+        # Execute the generation script without blocking the event loop
+        start_time = time.time()
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd_args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=subproc_env
+        )
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                proc.communicate(article_input),
+                timeout=settings.generation_timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error("❌ Generation timed out")
+            raise HTTPException(
+                status_code=408,
+                detail=f"Generation timed out after {settings.generation_timeout} seconds"
+            )
+
+        generation_time = time.time() - start_time
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
+
+        if proc.returncode != 0:
+            logger.error(f"❌ Generation failed: {stderr}")
+
+        return proc.returncode, stdout_bytes, stderr, generation_time
+
+    @app.get("/status")
+    async def service_status():
+        """Get service status and capabilities"""
+        return {
+            "available": generator_path.exists(),
+            "service": service_name,
+            "python_version": sys.version,
+            "generator_script": str(generator_path.absolute()) if generator_path.exists() else "Not found",
+            "output_directory": str(output_dir.absolute()),
+            "output_dir_exists": output_dir.exists(),
+            "supported_clients": SUPPORTED_CLIENTS
+        }
+
+    @app.post("/generate", response_model=GenerateResponse)
+    async def generate_cover(request: GenerateRequest):
+        """Generate a cover image using the LoRA AI system"""
+
+        try:
+            logger.info(f"🎨 Generating cover for: {request.title}")
+
+            # Unique per-request filename so concurrent clients never overwrite each other
+            client_id = request.client_id or "generic"
+            output_file = f"boxed_cover_{client_id}_{uuid.uuid4().hex}.png"
+            output_path = output_dir / output_file
+
+            returncode, stdout_bytes, stderr, generation_time = await run_generator(
+                request, str(output_path)
+            )
+            stdout = stdout_bytes.decode("utf-8", errors="replace")
+
+            if returncode != 0:
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "error": "Generation script failed",
+                        "stderr": stderr,
+                        "stdout": stdout
+                    }
+                )
+
+            if not output_path.exists():
+                logger.error(f"❌ Output file not found: {output_path}")
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "error": "Output file not created",
+                        "expected_path": str(output_path),
+                        "stdout": stdout
+                    }
+                )
+
+            # Return success response
+            image_url = f"/images/{output_file}"
+
+            logger.info(f"✅ Cover generated successfully: {image_url}")
+
+            return GenerateResponse(
+                success=True,
+                image_url=image_url,
+                image_path=str(output_path),
+                generation_time=generation_time,
+                metadata={
+                    "client_id": client_id,
+                    "title": request.title,
+                    "subtitle": request.subtitle,
+                    "style": request.style,
+                    "size": request.size,
+                    "stdout": stdout.split('\n')[-10:] if stdout else []
+                }
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Unexpected error: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Unexpected error during generation",
+                    "message": str(e)
+                }
+            )
+
+    @app.post("/generate/image")
+    async def generate_cover_image(request: GenerateRequest, palette: bool = False):
+        """Generate a cover and return the PNG bytes directly (no disk round-trip)"""
+        logger.info(f"🎨 Generating cover image for: {request.title}")
+
+        returncode, png, stderr, _ = await run_generator(request, "-")
+        if returncode != 0:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Generation script failed",
+                    "stderr": stderr
+                }
+            )
+
+        if palette:
+            png = await asyncio.to_thread(_requantize_png, png)
+        return Response(content=png, media_type="image/png")
+
+def _add_inproc_routes(app: FastAPI, service_name: str, settings: ServiceSettings):
+    """Generation with ProductionCoverGenerator kept loaded in this process"""
+    output_dir = settings.output_dir
+    # The SDXL pipeline is not safe to drive from several threads at once
+    generator_lock = asyncio.Lock()
+
+    async def render_cover(request: GenerateRequest):
+        """Run the SDXL generator off the event loop; returns (PIL image, seconds)"""
+        async with generator_lock:
+            generator = app.state.generator
+            start_time = time.time()
+            cover = await asyncio.to_thread(
+                generator.generate_article_cover,
+                title=request.title,
+                subtitle=request.subtitle or "",
+                style=request.style or "dark",
+                company_logo=request.client_id or "generic"
+            )
+            generation_time = time.time() - start_time
+
+        if cover is None:
+            raise HTTPException(status_code=500, detail="Cover generation failed")
+        return cover, generation_time
+
+    @app.get("/status")
+    async def service_status():
+        """Get service status and capabilities"""
+        return {
+            "available": True,
+            "service": service_name,
+            "python_version": sys.version,
+            "generator_loaded": getattr(app.state, "generator", None) is not None,
+            "output_directory": str(output_dir.absolute()),
+            "supported_clients": SUPPORTED_CLIENTS
+        }
+
+    @app.post("/generate", response_model=GenerateResponse)
+    async def generate_cover(request: GenerateRequest):
+        """Generate a cover image with the in-process SDXL pipeline"""
+        logger.info(f"🎨 Generating cover for: {request.title}")
+        client_id = request.client_id or "generic"
+
+        cover, generation_time = await render_cover(request)
+
+        output_file = f"cover_{client_id}_{uuid.uuid4().hex}.png"
+        output_path = output_dir / output_file
+        await asyncio.to_thread(cover.save, output_path)
+
+        image_url = f"/images/{output_file}"
+        logger.info(f"✅ Cover generated successfully: {image_url}")
+
+        return GenerateResponse(
+            success=True,
+            image_url=image_url,
+            image_path=str(output_path),
+            generation_time=generation_time,
+            metadata={
+                "client_id": client_id,
+                "title": request.title,
+                "subtitle": request.subtitle,
+                "style": request.style,
+                "size": request.size
+            }
+        )
+
+    @app.post("/generate/image")
+    async def generate_cover_image(request: GenerateRequest, palette: bool = False):
+        """Generate a cover and return the PNG bytes directly (no disk round-trip)"""
+        logger.info(f"🎨 Generating cover image for: {request.title}")
+
+        cover, _ = await render_cover(request)
+        png = await asyncio.to_thread(_encode_png, cover, palette)
+        return Response(content=png, media_type="image/png")
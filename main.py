@@ -4,113 +4,32 @@ AI Cover Generator Service - WORKING VERSION
 FastAPI service for Railway deployment with proper endpoints
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
 import os
-import sys
 import logging
 
+from app_factory import create_app, get_settings
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
-app = FastAPI(
-    title="AI Cover Generator",
-    description="Cover generation service for crypto news",
-    version="1.0.0"
-)
-
-# Enable CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Request models
-class GenerateRequest(BaseModel):
-    title: str
-    subtitle: Optional[str] = None
-    client_id: Optional[str] = "generic"
-    article_content: Optional[str] = None
-    style: Optional[str] = "professional"
-    size: Optional[str] = "1792x896"
-
-class GenerateResponse(BaseModel):
-    success: bool
-    image_url: Optional[str] = None
-    error: Optional[str] = None
+COVER_MODE = os.environ.get("COVER_MODE", "mock")
 
-@app.get("/", include_in_schema=True)
-async def root():
-    """Root endpoint"""
-    logger.info("Root endpoint accessed")
-    return {
-        "service": "AI Cover Generator",
-        "status": "running",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "status": "/status",
-            "generate": "/generate"
-        }
-    }
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    logger.info("Health check accessed")
-    return {
-        "status": "healthy",
-        "service": "AI Cover Generator",
-        "version": "1.0.0"
-    }
-
-@app.get("/status")
-async def service_status():
-    """Get service status"""
-    logger.info("Status endpoint accessed")
-    return {
-        "available": True,
-        "service": "AI Cover Generator",
-        "python_version": sys.version,
-        "supported_clients": [
-            "hedera", "algorand", "constellation", 
-            "bitcoin", "ethereum", "generic"
-        ]
-    }
-
-@app.post("/generate")
-async def generate_cover(request: GenerateRequest):
-    """Generate a cover image"""
-    
-    try:
-        logger.info(f"🎨 Generate endpoint accessed for: {request.title}")
-        
-        # Return a working placeholder response
-        placeholder_url = f"https://via.placeholder.com/1800x900/4A90E2/FFFFFF?text={request.title.replace(' ', '+')}"
-        
-        return {
-            "success": True,
-            "image_url": placeholder_url,
-            "error": None
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ Error: {str(e)}")
-        return {
-            "success": False,
-            "image_url": None,
-            "error": str(e)
-        }
+# Create FastAPI app
+app = create_app(COVER_MODE)
 
 if __name__ == "__main__":
     import uvicorn
-    port = int(os.environ.get("PORT", 8000))
-    logger.info(f"🚀 Starting AI Cover Generator on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    port = get_settings().port
+    # Generator backends keep state in-process; only the mock service scales out
+    default_workers = (os.cpu_count() or 1) * 2 + 1 if COVER_MODE == "mock" else 1
+    workers = int(os.environ.get("WEB_CONCURRENCY", default_workers))
+    logger.info(f"🚀 Starting AI Cover Generator ({COVER_MODE}) on port {port} with {workers} workers")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools"
+    )
@@ -5,19 +5,55 @@ Combines all improvements: watermark overlay, title integration, style training
 """
 import torch
 from diffusers import StableDiffusionXLPipeline, DPMSolverMultistepScheduler
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
 import os
 import argparse
 import json
+import zlib
+from functools import lru_cache
 from pathlib import Path
 
+FONT_PATH = "/System/Library/Fonts/Arial.ttc"
+
+_STYLE_PROMPTS = {
+    "dark": [
+        "dark cyberpunk technology background, holographic data visualization, neon blue and cyan lighting, 3D blockchain cubes floating in space, digital matrix atmosphere, professional tech aesthetic, depth of field, cinematic lighting",
+        "futuristic dark interface design, glowing circuit patterns, digital data streams, cyberpunk atmosphere with purple and blue neon accents, 3D geometric elements, tech industry professional background",
+        "dark sci-fi technology background, holographic displays, neon grid patterns, blockchain visualization, digital technology theme, professional article cover aesthetic, atmospheric lighting"
+    ],
+    "colorful": [
+        "cosmic purple and pink gradient space background, ethereal nebula atmosphere, floating spheres and planets, aurora light effects, otherworldly sci-fi environment, dreamy cosmic landscape",
+        "vibrant cosmic nebula scene, purple pink orange gradient colors, floating cosmic orbs, energy light beams, space phenomena, ethereal atmosphere, futuristic cover background",
+        "psychedelic space background, cosmic aurora colors, floating planetary spheres, light beam effects, vibrant sci-fi aesthetic, otherworldly landscape, cosmic energy"
+    ],
+    "light": [
+        "clean minimal corporate background, soft gradients, professional business design, contemporary aesthetic, light blue and white tones, sophisticated layout",
+        "bright modern professional background, subtle geometric patterns, light colors, clean corporate style, minimal design elements",
+        "light corporate background, minimal geometric elements, soft gradients, professional business design, clean modern aesthetic"
+    ]
+}
+
+_COMPANY_FRAGMENTS = {
+    "hedera": "Hedera hashgraph elements, distributed ledger visualization, geometric H patterns",
+    "bitcoin": "Bitcoin blockchain elements, cryptocurrency visualization, digital gold themes"
+}
+
+_measure_draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+@lru_cache(maxsize=512)
+def _measure(text, font):
+    """Cached text bounding box - fonts are loaded once per generator"""
+    return _measure_draw.textbbox((0, 0), text, font=font)
+
 class ProductionCoverGenerator:
     def __init__(self):
         self.device = "mps" if torch.backends.mps.is_available() else "cpu"
         self.pipeline = None
         self.watermark = None
+        self._rng = torch.Generator(device=self.device)
         self.setup_pipeline()
         self.load_watermark()
+        self.load_fonts()
         
     def setup_pipeline(self):
         """Load optimized SDXL pipeline"""
@@ -50,30 +86,26 @@ class ProductionCoverGenerator:
         try:
             self.watermark = Image.open(watermark_path).convert("RGBA")
             print(f"✅ Loaded watermark: {self.watermark.size}")
+            # Pre-flatten at cover size: RGB layer + alpha mask for paste()
+            watermark_1800x900 = self.watermark.resize((1800, 900), Image.Resampling.LANCZOS)
+            self.wm_rgb = watermark_1800x900.convert("RGB")
+            self.wm_alpha = watermark_1800x900.getchannel("A")
         except Exception as e:
             print(f"⚠️  No watermark found: {e}")
             self.watermark = None
     
+    def load_fonts(self):
+        """Load title and subtitle fonts once"""
+        try:
+            self.title_font = ImageFont.truetype(FONT_PATH, 64)
+            self.subtitle_font = ImageFont.truetype(FONT_PATH, 32)
+        except OSError:
+            self.title_font = ImageFont.load_default()
+            self.subtitle_font = self.title_font
+    
     def get_style_prompts(self, style="dark"):
         """Get enhanced prompts for different styles"""
-        prompts = {
-            "dark": [
-                "dark cyberpunk technology background, holographic data visualization, neon blue and cyan lighting, 3D blockchain cubes floating in space, digital matrix atmosphere, professional tech aesthetic, depth of field, cinematic lighting",
-                "futuristic dark interface design, glowing circuit patterns, digital data streams, cyberpunk atmosphere with purple and blue neon accents, 3D geometric elements, tech industry professional background",
-                "dark sci-fi technology background, holographic displays, neon grid patterns, blockchain visualization, digital technology theme, professional article cover aesthetic, atmospheric lighting"
-            ],
-            "colorful": [
-                "cosmic purple and pink gradient space background, ethereal nebula atmosphere, floating spheres and planets, aurora light effects, otherworldly sci-fi environment, dreamy cosmic landscape",
-                "vibrant cosmic nebula scene, purple pink orange gradient colors, floating cosmic orbs, energy light beams, space phenomena, ethereal atmosphere, futuristic cover background",
-                "psychedelic space background, cosmic aurora colors, floating planetary spheres, light beam effects, vibrant sci-fi aesthetic, otherworldly landscape, cosmic energy"
-            ],
-            "light": [
-                "clean minimal corporate background, soft gradients, professional business design, contemporary aesthetic, light blue and white tones, sophisticated layout",
-                "bright modern professional background, subtle geometric patterns, light colors, clean corporate style, minimal design elements",
-                "light corporate background, minimal geometric elements, soft gradients, professional business design, clean modern aesthetic"
-            ]
-        }
-        return prompts.get(style, prompts["dark"])
+        return _STYLE_PROMPTS.get(style, _STYLE_PROMPTS["dark"])
     
     def generate_article_cover(self, title="", subtitle="", style="dark", company_logo="", custom_prompt=""):
         """Generate complete article cover with title and watermark"""
@@ -86,47 +118,44 @@ class ProductionCoverGenerator:
             base_prompt = prompts[0]  # Use primary prompt for style
         
         # Add company-specific elements if provided
-        if company_logo.lower() == "hedera":
-            base_prompt += ", Hedera hashgraph elements, distributed ledger visualization, geometric H patterns"
-        elif company_logo.lower() == "bitcoin":
-            base_prompt += ", Bitcoin blockchain elements, cryptocurrency visualization, digital gold themes"
+        fragment = _COMPANY_FRAGMENTS.get(company_logo.lower() if company_logo else "", "")
+        if fragment:
+            base_prompt += ", " + fragment
         
         print(f"\n🎨 Generating {style} style cover...")
         print(f"📰 Title: {title}")
         print(f"📝 Base prompt: {base_prompt[:80]}...")
         
+        # Deterministic per-article seed so identical requests reproduce the same cover
+        seed = zlib.crc32(f"{title}|{subtitle}|{style}|{company_logo}|{custom_prompt}".encode("utf-8")) & 0xFFFFFFFF
+        self._rng.manual_seed(seed)
+        
         try:
             # Generate base image
             image = self.pipeline(
                 prompt=base_prompt,
                 negative_prompt="text, letters, words, existing logos, watermarks, signatures, low quality, blurry, amateur, ugly",
-                width=1792,
+                width=1800,
                 height=896,
                 num_inference_steps=25,
                 guidance_scale=7.5,
                 num_images_per_prompt=1,
-                generator=torch.Generator(device=self.device).manual_seed(42)
+                generator=self._rng
             ).images[0]
             
-            # Resize to exact specification (1800x900)
-            resized_image = image.resize((1800, 900), Image.Resampling.LANCZOS)
-            base_rgba = resized_image.convert("RGBA")
+            # Letterbox 2px top/bottom to reach exact specification (1800x900)
+            base_image = ImageOps.expand(image, border=(0, 2, 0, 2), fill=(0, 0, 0))
             
-            # Add title overlay if provided
+            # Draw title directly on the base image if provided
             if title:
-                title_overlay = Image.new("RGBA", (1800, 900), (0, 0, 0, 0))
-                draw = ImageDraw.Draw(title_overlay)
+                # "RGBA" draw mode blends the translucent shadows onto the RGB base
+                draw = ImageDraw.Draw(base_image, "RGBA")
                 
-                # Load fonts
-                try:
-                    title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttc", 64)
-                    subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttc", 32)
-                except:
-                    title_font = ImageFont.load_default()
-                    subtitle_font = ImageFont.load_default()
+                title_font = self.title_font
+                subtitle_font = self.subtitle_font
                 
                 # Calculate title positioning
-                title_bbox = draw.textbbox((0, 0), title.upper(), font=title_font)
+                title_bbox = _measure(title.upper(), title_font)
                 title_width = title_bbox[2] - title_bbox[0]
                 title_x = (1800 - title_width) // 2
                 title_y = 120
@@ -137,26 +166,18 @@ class ProductionCoverGenerator:
                 
                 # Add subtitle if provided
                 if subtitle:
-                    subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
+                    subtitle_bbox = _measure(subtitle, subtitle_font)
                     subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
                     subtitle_x = (1800 - subtitle_width) // 2
                     subtitle_y = title_y + 80
                     
                     draw.text((subtitle_x + 2, subtitle_y + 2), subtitle, fill=(0, 0, 0, 150), font=subtitle_font)
                     draw.text((subtitle_x, subtitle_y), subtitle, fill=(200, 200, 200, 255), font=subtitle_font)
-                
-                # Composite title
-                base_rgba = Image.alpha_composite(base_rgba, title_overlay)
             
             # Apply watermark overlay (full-size centered)
             if self.watermark:
-                full_size_watermark = self.watermark.resize((1800, 900), Image.Resampling.LANCZOS)
-                final_image = Image.alpha_composite(base_rgba, full_size_watermark)
-            else:
-                final_image = base_rgba
-            
-            # Convert to RGB and return
-            final_rgb = final_image.convert("RGB")
+                base_image.paste(self.wm_rgb, (0, 0), self.wm_alpha)
+            final_rgb = base_image
             
             print("✅ Cover generation complete")
             return final_rgb
@@ -5,36 +5,167 @@ Uses your custom font collection with elegant styling
 """
 import torch
 from diffusers import StableDiffusionXLPipeline, DPMSolverMultistepScheduler
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+import numpy as np
 import os
 import random
 import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+logger = logging.getLogger(__name__)
+
+# Loaded once per process per option set and shared by generator instances with those options:
+# (device, use_lcm, int8_unet, backend, compile_unet) -> (pipeline, num_steps, guidance_scale)
+_PIPELINES = {}
+
+FONT_SIZES = {
+    "title": 150,
+    "subtitle": 80,
+    "small": 50
+}
+
+NEGATIVE_PROMPT = "text, letters, words, titles, subtitles, existing logos, watermarks, signatures, typography, fonts, readable text, characters, alphabet, numbers, low quality, blurry, amateur, ugly"
+
+# Static-shape ONNX exports and TensorRT engines, keyed by latent shape + dtype
+ONNX_CACHE_DIR = os.path.expanduser("~/.cache/sdxl_trt")
+
+FALLBACK_FONTS = [
+    "/System/Library/Fonts/Arial.ttc",
+    "/System/Library/Fonts/Helvetica.ttc"
+]
+
+@lru_cache(maxsize=64)
+def _load_font(path, size):
+    """Parse a TrueType/OpenType font once per (path, size)"""
+    return ImageFont.truetype(path, size)
+
+@lru_cache(maxsize=4096)
+def _bbox(font, text):
+    """Cached text bounding box - fonts from _load_font are stable singletons"""
+    return font.getbbox(text)
+
+@lru_cache(maxsize=4096)
+def _length(font, text):
+    """Cached advance width - cheaper than a full bbox for centering"""
+    return font.getlength(text)
+
+def _wrap(text, font, max_w):
+    """Split text at its middle word (or character) if it is wider than max_w
+    
+    Returns [(line, width), ...] so callers can center without re-measuring.
+    """
+    width = _length(font, text)
+    if width <= max_w:
+        return [(text, width)]
+    words = text.split()
+    if len(words) > 1:
+        mid = len(words) // 2
+        lines = [" ".join(words[:mid]), " ".join(words[mid:])]
+    else:
+        mid = len(text) // 2
+        lines = [text[:mid], text[mid:]]
+    return [(line, _length(font, line)) for line in lines]
+
+@lru_cache(maxsize=256)
+def _line_mask(font, text):
+    """Rasterize a text line once into a float coverage mask plus its bbox offset"""
+    left, top, right, bottom = _bbox(font, text)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return np.asarray(mask, dtype=np.float32) / 255.0, left, top
+
+def _fill_mask(canvas, font, text, xy, ink):
+    """Fill ink through a text mask the way ImageDraw.text does on an RGBA image"""
+    mask, left, top = _line_mask(font, text)
+    x, y = xy[0] + left, xy[1] + top
+    h, w = mask.shape
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, canvas.shape[1]), min(y + h, canvas.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    
+    ink = np.asarray(ink, dtype=np.float32)
+    coverage = mask[y0 - y:y1 - y, x0 - x:x1 - x, None]
+    region = canvas[y0:y1, x0:x1].astype(np.float32)
+    # Like Pillow, colour takes the ink outright where the canvas is still fully transparent
+    colour_coverage = np.where((region[..., 3:] == 0) & (coverage > 0), 1.0, coverage)
+    region[..., :3] += (ink[:3] - region[..., :3]) * colour_coverage
+    region[..., 3:] += (ink[3] - region[..., 3:]) * coverage
+    canvas[y0:y1, x0:x1] = (region + 0.5).astype(np.uint8)
+
+class _UNetExport(torch.nn.Module):
+    """Flatten the SDXL UNet call into positional tensors for ONNX export"""
+    def __init__(self, unet):
+        super().__init__()
+        self.unet = unet
+    
+    def forward(self, sample, timestep, encoder_hidden_states, text_embeds, time_ids):
+        added_cond_kwargs = {"text_embeds": text_embeds, "time_ids": time_ids}
+        return self.unet(
+            sample,
+            timestep,
+            encoder_hidden_states=encoder_hidden_states,
+            added_cond_kwargs=added_cond_kwargs,
+            return_dict=False
+        )[0]
 
 class RandomizedFontGenerator:
-    def __init__(self):
+    def __init__(self, compile_unet=False, use_lcm=False, int8_unet=False, backend="torch"):
         self.device = "mps" if torch.backends.mps.is_available() else "cpu"
         self.pipeline = None
         self.watermark = None
+        self.compile_unet = compile_unet
+        self.use_lcm = use_lcm
+        self.int8_unet = int8_unet
+        self._unet_quantized = False
+        self.backend = backend
+        # DPM++ 2M Karras converges well by 15 steps for cover backgrounds
+        self.num_steps = 15
+        self.guidance_scale = 7.5
+        self._embed_cache = {}
+        self._last_fonts = (None, None)
+        # Text overlays render on the CPU while the pipeline runs on the device
+        self._pool = ThreadPoolExecutor(max_workers=2)
         self.custom_fonts = [
             '/Users/valorkopeny/Library/Fonts/StyreneA-Black-Trial-BF63f6cbd9da245.otf',
             '/Users/valorkopeny/Library/Fonts/StretchPro.otf',
             '/Users/valorkopeny/Library/Fonts/fonnts.com-Aeonik-Bold.ttf'
         ]
+        # Resolve font files once so per-generation selection is a list lookup
+        self.available_fonts = [path for path in self.custom_fonts if os.path.exists(path)]
+        self.fallback_font = next((path for path in FALLBACK_FONTS if os.path.exists(path)), None)
+        if not self.available_fonts:
+            logger.warning("⚠️  No custom fonts found, using %s", self.fallback_font or 'default font')
         self.setup_pipeline()
         self.load_watermark()
         
     def setup_pipeline(self):
         """Load optimized SDXL pipeline"""
-        print(f"🖥️  Using device: {self.device}")
-        print("🔄 Loading Stable Diffusion XL...")
+        logger.debug("🖥️  Using device: %s", self.device)
+        options = (self.device, self.use_lcm, self.int8_unet, self.backend, self.compile_unet)
+        cached = _PIPELINES.get(options)
+        if cached is not None:
+            # Sampling settings travel with the pipeline (an LCM-fused UNet needs 4 steps, CFG 1.0)
+            self.pipeline, self.num_steps, self.guidance_scale = cached
+            logger.debug("♻️  Reusing loaded pipeline")
+            return
+        
+        logger.debug("🔄 Loading Stable Diffusion XL...")
         
         model_id = "stabilityai/stable-diffusion-xl-base-1.0"
         
+        dtype = self.select_dtype()
+        logger.debug("🔢 Using dtype: %s", dtype)
+        
         self.pipeline = StableDiffusionXLPipeline.from_pretrained(
             model_id,
-            torch_dtype=torch.float32,
+            torch_dtype=dtype,
             use_safetensors=True,
-            variant=None
+            variant="fp16" if dtype == torch.float16 else None
         )
         
         self.pipeline.scheduler = DPMSolverMultistepScheduler.from_config(
@@ -42,70 +173,268 @@ class RandomizedFontGenerator:
             use_karras_sigmas=True
         )
         
+        # Cover art needs neither per-step progress output nor NSFW filtering
+        self.pipeline.set_progress_bar_config(disable=True)
+        if getattr(self.pipeline, "safety_checker", None) is not None:
+            self.pipeline.safety_checker = None
+            self.pipeline.feature_extractor = None
+        
         if self.device == "mps":
+            # Slicing instead of CPU offload (a CUDA path that thrashes host<->device on MPS)
             self.pipeline = self.pipeline.to(self.device)
-            self.pipeline.enable_model_cpu_offload()
+            # Cap the MPS caching allocator so blocks are reused across steps/covers instead of growing
+            if hasattr(torch.mps, "set_per_process_memory_fraction"):
+                torch.mps.set_per_process_memory_fraction(0.9)
+            self.pipeline.enable_attention_slicing("auto")
+            self.pipeline.enable_vae_slicing()
+            self.pipeline.enable_vae_tiling()
+        elif dtype == torch.bfloat16:
+            self.optimize_cpu_unet()
+        
+        if self.int8_unet:
+            self.quantize_unet()
+        
+        if self.use_lcm:
+            self.enable_lcm()
+        
+        if self.backend != "torch":
+            self.enable_onnx_unet()
+        elif self.compile_unet:
+            self.compile_pipeline()
+            
+        _PIPELINES[options] = (self.pipeline, self.num_steps, self.guidance_scale)
+        logger.debug("✅ Pipeline ready")
+    
+    def select_dtype(self):
+        """fp16 on MPS, bf16 on CPUs with native AVX-512 BF16/AMX, otherwise fp32"""
+        if self.device == "mps":
+            return torch.float16
+        bf16_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+        if bf16_supported is not None and bf16_supported():
+            return torch.bfloat16
+        return torch.float32
+    
+    def optimize_cpu_unet(self):
+        """Apply IPEX bf16 kernels to the UNet when intel-extension-for-pytorch is installed"""
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            return
+        self.pipeline.unet = ipex.optimize(self.pipeline.unet.eval(), dtype=torch.bfloat16)
+        logger.debug("⚡ IPEX bf16 UNet enabled")
+    
+    def quantize_unet(self):
+        """Quantize UNet weights to int8 with optimum-quanto"""
+        try:
+            from optimum.quanto import quantize, qint8, freeze
+        except ImportError:
+            logger.warning("⚠️  optimum-quanto not installed, keeping full-precision UNet")
+            return
+        quantize(self.pipeline.unet, weights=qint8)
+        freeze(self.pipeline.unet)
+        self._unet_quantized = True
+        logger.debug("⚡ int8 UNet weights enabled")
+    
+    def enable_lcm(self):
+        """Fuse the LCM-LoRA distillation weights for 4-step generation"""
+        try:
+            from diffusers import LCMScheduler
+        except ImportError:
+            logger.warning("⚠️  LCMScheduler requires diffusers>=0.22, keeping DPM++ 2M Karras")
+            return
+        
+        try:
+            self.pipeline.load_lora_weights("latent-consistency/lcm-lora-sdxl")
+            self.pipeline.fuse_lora()
+            self.pipeline.scheduler = LCMScheduler.from_config(self.pipeline.scheduler.config)
+            self.num_steps = 4
+            self.guidance_scale = 1.0
+            logger.debug("⚡ LCM-LoRA enabled (4 steps)")
+        except Exception as e:
+            logger.warning("⚠️  Failed to load LCM-LoRA, keeping DPM++ 2M Karras: %s", e)
+    
+    def enable_onnx_unet(self):
+        """Run UNet steps through ONNX Runtime (TensorRT or CoreML EP) at the fixed cover shape"""
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.warning("⚠️  onnxruntime not installed, using torch UNet")
+            return
+        
+        unet = self.pipeline.unet
+        if unet.dtype == torch.bfloat16:
+            logger.warning("⚠️  ONNX Runtime has no bf16 numpy inputs, using torch UNet")
+            return
+        
+        latent_h, latent_w = 896 // 8, 1800 // 8
+        dtype_name = str(unet.dtype).split(".")[-1]
+        cache_key = (
+            f"unet_{latent_w}x{latent_h}_{dtype_name}"
+            + ("_int8" if self._unet_quantized else "")
+            + ("_lcm" if self.num_steps == 4 else "")
+        )
+        cache_dir = os.path.join(ONNX_CACHE_DIR, cache_key)
+        onnx_path = os.path.join(cache_dir, "unet.onnx")
+        
+        try:
+            if not os.path.exists(onnx_path):
+                os.makedirs(cache_dir, exist_ok=True)
+                logger.debug("🔧 Exporting UNet to ONNX (%s)...", onnx_path)
+                dtype, device = unet.dtype, unet.device
+                sample_inputs = (
+                    torch.randn(2, unet.config.in_channels, latent_h, latent_w, dtype=dtype, device=device),
+                    torch.tensor(999.0, device=device),
+                    torch.randn(2, 77, unet.config.cross_attention_dim, dtype=dtype, device=device),
+                    torch.randn(2, self.pipeline.text_encoder_2.config.projection_dim, dtype=dtype, device=device),
+                    torch.randn(2, 6, dtype=dtype, device=device)
+                )
+                input_names = ["sample", "timestep", "encoder_hidden_states", "text_embeds", "time_ids"]
+                # Only the batch axis varies (CFG pairs, batched covers); spatial dims stay static
+                dynamic_axes = {name: {0: "batch"} for name in input_names if name != "timestep"}
+                dynamic_axes["noise_pred"] = {0: "batch"}
+                with torch.no_grad():
+                    torch.onnx.export(
+                        _UNetExport(unet),
+                        sample_inputs,
+                        onnx_path,
+                        input_names=input_names,
+                        output_names=["noise_pred"],
+                        dynamic_axes=dynamic_axes,
+                        opset_version=17
+                    )
             
-        print("✅ Pipeline ready")
+            if self.backend == "ort_trt":
+                providers = [
+                    ("TensorrtExecutionProvider", {
+                        "trt_engine_cache_enable": True,
+                        "trt_engine_cache_path": cache_dir,
+                        "trt_fp16_enable": True
+                    }),
+                    "CUDAExecutionProvider",
+                    "CPUExecutionProvider"
+                ]
+            else:
+                providers = ["CoreMLExecutionProvider", "CPUExecutionProvider"]
+            session = ort.InferenceSession(onnx_path, providers=providers)
+        except Exception as e:
+            logger.warning("⚠️  ONNX export/session failed, using torch UNet: %s", e)
+            return
+        
+        def onnx_forward(sample, timestep, encoder_hidden_states, added_cond_kwargs=None, return_dict=True, **kwargs):
+            feed = {
+                "sample": sample.cpu().numpy(),
+                "timestep": np.asarray(float(timestep), dtype=np.float32),
+                "encoder_hidden_states": encoder_hidden_states.cpu().numpy(),
+                "text_embeds": added_cond_kwargs["text_embeds"].cpu().numpy(),
+                "time_ids": added_cond_kwargs["time_ids"].cpu().numpy()
+            }
+            noise_pred = torch.from_numpy(session.run(None, feed)[0]).to(sample.device)
+            if not return_dict:
+                return (noise_pred,)
+            from diffusers.models.unet_2d_condition import UNet2DConditionOutput
+            return UNet2DConditionOutput(sample=noise_pred)
+        
+        # Keep the module (config/dtype/device lookups) and swap only its forward
+        unet.forward = onnx_forward
+        logger.debug("⚡ ONNX Runtime UNet enabled (%s)", session.get_providers()[0])
+    
+    def compile_pipeline(self):
+        """torch.compile the UNet and VAE decoder, capturing the graph with one warmup pass"""
+        if not hasattr(torch, "compile"):
+            logger.warning("⚠️  torch.compile requires PyTorch 2.0+, using eager pipeline")
+            return
+        if self.device == "mps":
+            logger.warning("⚠️  torch.compile has no MPS backend, using eager pipeline")
+            return
+        
+        eager_unet = self.pipeline.unet
+        eager_decode = self.pipeline.vae.decode
+        try:
+            self.pipeline.unet = torch.compile(eager_unet, mode="reduce-overhead", fullgraph=True)
+            self.pipeline.vae.decode = torch.compile(eager_decode)
+            
+            # Warm up at the fixed cover resolution so later covers reuse the compiled graph
+            logger.debug("🔧 Compiling UNet (warmup at 1800x896)...")
+            with torch.inference_mode():
+                self.pipeline(
+                    prompt="warmup",
+                    width=1800,
+                    height=896,
+                    num_inference_steps=2,
+                    guidance_scale=self.guidance_scale
+                )
+            logger.debug("✅ Compiled UNet ready")
+        except Exception as e:
+            logger.warning("⚠️  torch.compile failed, using eager pipeline: %s", e)
+            self.pipeline.unet = eager_unet
+            self.pipeline.vae.decode = eager_decode
+    
+    def release_cached_memory(self):
+        """Return cached device memory to the system after a generation"""
+        if self.device == "mps":
+            torch.mps.empty_cache()
     
     def load_watermark(self):
         """Load Genfinity watermark"""
         watermark_path = "/Users/valorkopeny/Desktop/genfinity-watermark.png"
         try:
             self.watermark = Image.open(watermark_path).convert("RGBA")
-            print(f"✅ Loaded watermark: {self.watermark.size}")
+            logger.debug("✅ Loaded watermark: %s", self.watermark.size)
+            # Resized once at cover resolution and reused for every generation
+            self._watermark_1800x900 = self.watermark.resize((1800, 900), Image.Resampling.LANCZOS)
+            # Only the non-transparent part of the watermark is ever blended
+            wm_bbox = self._watermark_1800x900.getchannel("A").getbbox()
+            self._watermark_region = (self._watermark_1800x900.crop(wm_bbox), wm_bbox[:2]) if wm_bbox else None
         except Exception as e:
-            print(f"⚠️  No watermark found: {e}")
+            logger.warning("⚠️  No watermark found: %s", e)
             self.watermark = None
     
     def get_random_fonts(self):
         """Load random selection from your custom fonts"""
-        fonts = {}
-        
-        # Font sizes
-        font_sizes = {
-            "title": 150,
-            "subtitle": 80,
-            "small": 50
-        }
-        
         # Randomly select a font for this generation
-        selected_font_path = random.choice(self.custom_fonts)
-        font_name = os.path.basename(selected_font_path).split('.')[0]
+        selected_font_path = random.choice(self.available_fonts) if self.available_fonts else self.fallback_font
+        font_name = os.path.basename(selected_font_path).split('.')[0] if selected_font_path else "default"
         
-        print(f"🎲 Selected font: {font_name}")
+        logger.debug("🎲 Selected font: %s", font_name)
         
-        # Load the selected font in different sizes
-        for size_name, size in font_sizes.items():
+        # Same pick as last time: reuse the loaded size set as-is
+        last_path, last_fonts = self._last_fonts
+        if last_fonts is not None and last_path == selected_font_path:
+            return last_fonts, font_name
+        
+        fonts = {}
+        # Load the selected font in different sizes (cached after first use)
+        for size_name, size in FONT_SIZES.items():
             try:
-                if os.path.exists(selected_font_path):
-                    fonts[size_name] = ImageFont.truetype(selected_font_path, size)
-                    print(f"✅ Loaded {size_name}: {size}px")
-                else:
-                    raise FileNotFoundError(f"Font not found: {selected_font_path}")
+                fonts[size_name] = _load_font(selected_font_path, size)
             except Exception as e:
-                print(f"⚠️  Failed to load {selected_font_path}: {e}")
-                # Fallback to system fonts
-                fallback_fonts = [
-                    "/System/Library/Fonts/Arial.ttc",
-                    "/System/Library/Fonts/Helvetica.ttc"
-                ]
-                for fallback in fallback_fonts:
-                    try:
-                        if os.path.exists(fallback):
-                            fonts[size_name] = ImageFont.truetype(fallback, size)
-                            print(f"📝 Fallback to system font: {size}px")
-                            break
-                    except:
-                        continue
-                
-                # Final fallback
-                if size_name not in fonts:
-                    fonts[size_name] = ImageFont.load_default()
-                    print(f"⚠️  Using default font for {size_name}")
+                logger.warning("⚠️  Failed to load %s: %s", selected_font_path, e)
+                fonts[size_name] = ImageFont.load_default()
+                logger.warning("⚠️  Using default font for %s", size_name)
         
+        self._last_fonts = (selected_font_path, fonts)
         return fonts, font_name
     
+    def get_prompt_embeds(self, prompt):
+        """Encode prompt + fixed negative prompt once and reuse the text-encoder outputs"""
+        if prompt not in self._embed_cache:
+            with torch.inference_mode():
+                (prompt_embeds, negative_prompt_embeds,
+                 pooled_prompt_embeds, negative_pooled_prompt_embeds) = self.pipeline.encode_prompt(
+                    prompt=prompt,
+                    negative_prompt=NEGATIVE_PROMPT,
+                    device=self.device,
+                    num_images_per_prompt=1,
+                    do_classifier_free_guidance=True
+                )
+            self._embed_cache[prompt] = {
+                "prompt_embeds": prompt_embeds,
+                "negative_prompt_embeds": negative_prompt_embeds,
+                "pooled_prompt_embeds": pooled_prompt_embeds,
+                "negative_pooled_prompt_embeds": negative_pooled_prompt_embeds
+            }
+        return self._embed_cache[prompt]
+    
     def get_style_prompts(self, style="dark"):
         """Get enhanced prompts for different styles"""
         prompts = {
@@ -115,46 +444,29 @@ class RandomizedFontGenerator:
         }
         return prompts.get(style, prompts["dark"])
     
-    def create_elegant_text_overlay(self, width, height, title, subtitle="", fonts=None, font_name=""):
-        """Create elegant text overlay with subtle shadows"""
+    def create_elegant_text_overlay(self, width, height, title, subtitle, fonts, font_name=""):
+        """Create elegant text overlay with subtle shadows, cropped to the drawn text
         
-        overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+        Returns (overlay, (x, y)) where (x, y) is the overlay's offset in the full-size cover.
+        """
         
-        if not fonts:
-            fonts, font_name = self.get_random_fonts()
+        # Lines are laid out first so the overlay only spans the union of their bboxes
+        draws = []
         
         # TITLE with elegant styling
         if title:
             title = title.upper()
             
             # Smart line breaking
-            bbox = draw.textbbox((0, 0), title, font=fonts["title"])
-            title_width = bbox[2] - bbox[0]
-            
-            if title_width > width * 0.9:
-                words = title.split()
-                if len(words) > 1:
-                    best_split = len(words) // 2
-                    line1 = " ".join(words[:best_split])
-                    line2 = " ".join(words[best_split:])
-                    title_lines = [line1, line2]
-                else:
-                    mid = len(title) // 2
-                    title_lines = [title[:mid], title[mid:]]
-            else:
-                title_lines = [title]
+            title_lines = _wrap(title, fonts["title"], width * 0.9)
             
             # Calculate positioning
             line_height = 180
             total_title_height = len(title_lines) * line_height
             start_y = (height - total_title_height) // 2 - 50
             
-            for i, line in enumerate(title_lines):
-                bbox = draw.textbbox((0, 0), line, font=fonts["title"])
-                text_width = bbox[2] - bbox[0]
-                
-                x = (width - text_width) // 2
+            for i, (line, text_width) in enumerate(title_lines):
+                x = int(width - text_width) // 2
                 y = start_y + (i * line_height)
                 
                 # SUBTLE shadow - much lighter and smaller offset
@@ -162,55 +474,57 @@ class RandomizedFontGenerator:
                 shadow_offset = 2  # Much smaller offset
                 shadow_color = (0, 0, 0, 60)  # Much more transparent (was 255)
                 
-                draw.text((x + shadow_offset, y + shadow_offset), line, fill=shadow_color, font=fonts["title"])
+                draws.append((fonts["title"], line, (x + shadow_offset, y + shadow_offset), shadow_color))
                 
                 # Main text - crisp white
-                draw.text((x, y), line, fill=(255, 255, 255, 255), font=fonts["title"])
+                draws.append((fonts["title"], line, (x, y), (255, 255, 255, 255)))
                 
-                print(f"📝 Title line {i+1}: '{line}' at ({x}, {y})")
+                logger.debug("📝 Title line %s: '%s' at (%s, %s)", i+1, line, x, y)
         
         # SUBTITLE with matching elegant styling
         if subtitle:
             subtitle_y = start_y + total_title_height + 60
             
-            bbox = draw.textbbox((0, 0), subtitle, font=fonts["subtitle"])
-            subtitle_width = bbox[2] - bbox[0]
-            
-            if subtitle_width > width * 0.9:
-                words = subtitle.split()
-                mid = len(words) // 2
-                line1 = " ".join(words[:mid])
-                line2 = " ".join(words[mid:])
-                subtitle_lines = [line1, line2]
-            else:
-                subtitle_lines = [subtitle]
+            subtitle_lines = _wrap(subtitle, fonts["subtitle"], width * 0.9)
             
-            for i, line in enumerate(subtitle_lines):
-                bbox = draw.textbbox((0, 0), line, font=fonts["subtitle"])
-                text_width = bbox[2] - bbox[0]
-                
-                x = (width - text_width) // 2
+            for i, (line, text_width) in enumerate(subtitle_lines):
+                x = int(width - text_width) // 2
                 y = subtitle_y + (i * 90)
                 
                 # Subtle subtitle shadow
                 shadow_offset = 1  # Even smaller for subtitle
                 shadow_color = (0, 0, 0, 40)  # Very light shadow
                 
-                draw.text((x + shadow_offset, y + shadow_offset), line, fill=shadow_color, font=fonts["subtitle"])
+                draws.append((fonts["subtitle"], line, (x + shadow_offset, y + shadow_offset), shadow_color))
                 
                 # Subtitle in elegant cyan
-                draw.text((x, y), line, fill=(0, 255, 255, 255), font=fonts["subtitle"])
+                draws.append((fonts["subtitle"], line, (x, y), (0, 255, 255, 255)))
                 
-                print(f"📝 Subtitle line {i+1}: '{line}' at ({x}, {y})")
+                logger.debug("📝 Subtitle line %s: '%s' at (%s, %s)", i+1, line, x, y)
         
-        return overlay
-    
-    def generate_cover_with_random_fonts(self, title="", subtitle="", style="dark", company="", custom_prompt=""):
-        """Generate cover with randomized fonts and elegant styling"""
+        if not draws:
+            return Image.new("RGBA", (1, 1)), (0, 0)
         
-        # Get random fonts for this generation
-        fonts, font_name = self.get_random_fonts()
+        # Union of the text bboxes, clipped to the cover
+        boxes = [
+            (x + left, y + top, x + right, y + bottom)
+            for font, line, (x, y), _ in draws
+            for left, top, right, bottom in [_bbox(font, line)]
+        ]
+        min_x = max(min(box[0] for box in boxes), 0)
+        min_y = max(min(box[1] for box in boxes), 0)
+        max_x = min(max(box[2] for box in boxes), width)
+        max_y = min(max(box[3] for box in boxes), height)
+        
+        # Each line is rasterized once and blended twice (shadow + main) into this buffer
+        overlay = np.zeros((max(max_y - min_y, 1), max(max_x - min_x, 1), 4), dtype=np.uint8)
+        for font, line, (x, y), ink in draws:
+            _fill_mask(overlay, font, line, (x - min_x, y - min_y), ink)
         
+        return Image.fromarray(overlay, "RGBA"), (min_x, min_y)
+    
+    def build_prompt(self, style="dark", company="", custom_prompt=""):
+        """Style (or custom) prompt plus company-specific elements"""
         # Use custom or style-based prompt
         if custom_prompt:
             base_prompt = custom_prompt
@@ -223,50 +537,203 @@ class RandomizedFontGenerator:
         elif company.lower() == "bitcoin":
             base_prompt += ", Bitcoin blockchain elements, cryptocurrency visualization"
         
-        print(f"\n🎨 Generating {style} style cover...")
-        print(f"🎲 Using font: {font_name}")
-        print(f"📰 Title: {title}")
-        print(f"📝 Subtitle: {subtitle}")
+        return base_prompt
+    
+    def submit_text_overlay(self, title, subtitle, fonts, font_name):
+        """Start rendering the text overlay in the background; None when there is no title"""
+        if not title:
+            return None
+        return self._pool.submit(self.create_elegant_text_overlay, 1800, 900, title, subtitle, fonts, font_name)
+    
+    def compose_cover(self, image, overlay_future):
+        """Letterbox the SDXL background and add text overlay + watermark"""
+        # Letterbox 2px top/bottom to reach exact specification (1800x900)
+        final_image = ImageOps.expand(image, border=(0, 2, 0, 2), fill=(0, 0, 0))
+        
+        # The base is opaque, so pasting through each layer's own alpha equals alpha compositing
+        # and only the text and watermark regions are touched
+        if overlay_future:
+            text_overlay, offset = overlay_future.result()
+            final_image.paste(text_overlay, offset, text_overlay)
+        
+        # Apply watermark
+        if self.watermark and self._watermark_region:
+            watermark, offset = self._watermark_region
+            final_image.paste(watermark, offset, watermark)
+        
+        return final_image
+    
+    def generate_cover_with_random_fonts(self, title="", subtitle="", style="dark", company="", custom_prompt=""):
+        """Generate cover with randomized fonts and elegant styling"""
+        
+        # Get random fonts for this generation
+        fonts, font_name = self.get_random_fonts()
+        
+        base_prompt = self.build_prompt(style, company, custom_prompt)
+        
+        logger.debug("🎨 Generating %s style cover...", style)
+        logger.debug("🎲 Using font: %s", font_name)
+        logger.debug("📰 Title: %s", title)
+        logger.debug("📝 Subtitle: %s", subtitle)
+        
+        overlay_future = self.submit_text_overlay(title, subtitle, fonts, font_name)
         
         try:
             # Generate clean background
-            image = self.pipeline(
-                prompt=base_prompt,
-                negative_prompt="text, letters, words, titles, subtitles, existing logos, watermarks, signatures, typography, fonts, readable text, characters, alphabet, numbers, low quality, blurry, amateur, ugly",
-                width=1792,
-                height=896,
-                num_inference_steps=25,
-                guidance_scale=7.5,
-                num_images_per_prompt=1,
-                generator=torch.Generator(device=self.device).manual_seed(random.randint(1, 1000))  # Random seed for variety
-            ).images[0]
+            with torch.inference_mode():
+                image = self.pipeline(
+                    **self.get_prompt_embeds(base_prompt),
+                    width=1800,
+                    height=896,
+                    num_inference_steps=self.num_steps,
+                    guidance_scale=self.guidance_scale,
+                    num_images_per_prompt=1,
+                    generator=torch.Generator(device=self.device).manual_seed(random.randint(1, 1000))  # Random seed for variety
+                ).images[0]
             
-            # Resize to exact specification
-            resized_image = image.resize((1800, 900), Image.Resampling.LANCZOS)
-            base_rgba = resized_image.convert("RGBA")
+            # Release cached allocator blocks between generations, never inside the denoising loop
+            self.release_cached_memory()
             
-            # Add elegant text overlay
-            if title:
-                text_overlay = self.create_elegant_text_overlay(1800, 900, title, subtitle, fonts, font_name)
-                base_rgba = Image.alpha_composite(base_rgba, text_overlay)
+            cover = self.compose_cover(image, overlay_future)
             
-            # Apply watermark
-            if self.watermark:
-                full_size_watermark = self.watermark.resize((1800, 900), Image.Resampling.LANCZOS)
-                final_image = Image.alpha_composite(base_rgba, full_size_watermark)
-            else:
-                final_image = base_rgba
-            
-            print("✅ Cover generation complete")
-            return final_image.convert("RGB"), font_name
+            logger.info("✅ Cover generation complete")
+            return cover, font_name
             
         except Exception as e:
-            print(f"❌ Cover generation failed: {str(e)}")
+            logger.error("❌ Cover generation failed: %s", e)
+            return None, None
+    
+    def generate_covers_batch(self, articles):
+        """Generate several covers in one SDXL forward pass; falls back to one at a time if memory runs out"""
+        prompts = [
+            self.build_prompt(a.get("style", "dark"), a.get("company", ""), a.get("custom_prompt", ""))
+            for a in articles
+        ]
+        
+        logger.debug("🎨 Batch generating %s backgrounds in one pass...", len(articles))
+        
+        # Fonts are picked and overlays started before the UNet runs
+        overlays = []
+        for article in articles:
+            fonts, font_name = self.get_random_fonts()
+            overlay_future = self.submit_text_overlay(article.get("title", ""), article.get("subtitle", ""), fonts, font_name)
+            overlays.append((overlay_future, font_name))
+        
+        try:
+            embeds = [self.get_prompt_embeds(prompt) for prompt in prompts]
+            batched_embeds = {key: torch.cat([e[key] for e in embeds]) for key in embeds[0]}
+            with torch.inference_mode():
+                images = self.pipeline(
+                    **batched_embeds,
+                    width=1800,
+                    height=896,
+                    num_inference_steps=self.num_steps,
+                    guidance_scale=self.guidance_scale,
+                    generator=[
+                        torch.Generator(device=self.device).manual_seed(random.randint(1, 1000))
+                        for _ in articles
+                    ]
+                ).images
+        except RuntimeError as e:
+            logger.warning("⚠️  Batched generation failed (%s), generating one at a time", e)
+            self.release_cached_memory()
+            for overlay_future, _ in overlays:
+                if overlay_future:
+                    overlay_future.cancel()
+            return [
+                self.generate_cover_with_random_fonts(
+                    title=a.get("title", ""),
+                    subtitle=a.get("subtitle", ""),
+                    style=a.get("style", "dark"),
+                    company=a.get("company", ""),
+                    custom_prompt=a.get("custom_prompt", "")
+                )
+                for a in articles
+            ]
+        
+        self.release_cached_memory()
+        
+        # Overlays were rendered during the pass; only pasting is left
+        results = []
+        for image, (overlay_future, font_name) in zip(images, overlays):
+            cover = self.compose_cover(image, overlay_future)
+            results.append((cover, font_name))
+        
+        logger.info("✅ Batch generation complete")
+        return results
+
+def _authkey_path(address):
+    return address + ".key"
+
+def _server_authkey(address):
+    """Fresh per-server secret, readable only by the owner; clients must present it"""
+    authkey = os.urandom(32)
+    fd = os.open(_authkey_path(address), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    return authkey
+
+def serve(address, generator):
+    """Keep the pipeline resident and render covers for --request clients over a Unix socket"""
+    if os.path.exists(address):
+        os.unlink(address)
+    authkey = _server_authkey(address)
+    
+    # Owner-only socket from the moment it is bound
+    old_umask = os.umask(0o177)
+    try:
+        listener = Listener(address, family="AF_UNIX", authkey=authkey)
+    finally:
+        os.umask(old_umask)
+    os.chmod(address, 0o600)
+    
+    with listener:
+        logger.info("🛰️  Serving covers on %s", address)
+        while True:
+            try:
+                conn = listener.accept()
+            except (EOFError, OSError, AuthenticationError) as e:
+                logger.warning("⚠️  Rejected connection: %s", e)
+                continue
+            
+            with conn:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError) as e:
+                    logger.warning("⚠️  Client went away before sending a request: %s", e)
+                    continue
+                
+                try:
+                    cover, font_name = generator.generate_cover_with_random_fonts(**request)
+                except Exception as e:
+                    logger.error("❌ Bad request: %s", e)
+                    cover, font_name = None, None
+                
+                # Raw RGB pixels skip a PNG encode/decode round trip on the same host
+                try:
+                    if cover:
+                        conn.send((cover.size, font_name))
+                        conn.send_bytes(cover.tobytes())
+                    else:
+                        conn.send((None, None))
+                except (EOFError, OSError) as e:
+                    logger.warning("⚠️  Client disconnected before the cover was sent: %s", e)
+                    continue
+
+def request_cover(address, **kwargs):
+    """Ask a --serve process for a cover instead of loading the pipeline"""
+    with open(_authkey_path(address), "rb") as f:
+        authkey = f.read()
+    with Client(address, family="AF_UNIX", authkey=authkey) as conn:
+        conn.send(kwargs)
+        size, font_name = conn.recv()
+        if size is None:
             return None, None
+        return Image.frombytes("RGB", size, conn.recv_bytes()), font_name
 
-def test_randomized_fonts():
+def test_randomized_fonts(compile_unet=False, use_lcm=False, int8_unet=False, backend="torch"):
     """Test randomized font system with multiple generations"""
-    generator = RandomizedFontGenerator()
+    generator = RandomizedFontGenerator(compile_unet=compile_unet, use_lcm=use_lcm, int8_unet=int8_unet, backend=backend)
     
     # Test cases to show font variety
     test_cases = [
@@ -292,16 +759,12 @@ def test_randomized_fonts():
     
     os.makedirs("/Users/valorkopeny/crypto-news-curator-backend/ai-cover-generator/style_outputs", exist_ok=True)
     
-    for i, test in enumerate(test_cases, 1):
+    # All test backgrounds share one batched SDXL pass
+    results = generator.generate_covers_batch(test_cases)
+    
+    for i, (test, (cover, font_name)) in enumerate(zip(test_cases, results), 1):
         print(f"\n🧪 Test {i}/{len(test_cases)}: {test['title']}")
         
-        cover, font_name = generator.generate_cover_with_random_fonts(
-            title=test["title"],
-            subtitle=test["subtitle"], 
-            style=test["style"],
-            company=test["company"]
-        )
-        
         if cover:
             # Include font name in filename
             safe_font = font_name.replace(' ', '_').replace('-', '_')[:20]
@@ -324,19 +787,37 @@ def main():
     parser.add_argument("--style", choices=["dark", "colorful", "light"], default="dark", help="Cover style")
     parser.add_argument("--company", type=str, default="", help="Company logo to integrate")
     parser.add_argument("--test", action="store_true", help="Run font randomization tests")
+    parser.add_argument("--compile", action="store_true", help="torch.compile the UNet (pays off over several covers)")
+    parser.add_argument("--lcm", action="store_true", help="Use LCM-LoRA for 4-step generation")
+    parser.add_argument("--int8", action="store_true", help="Quantize UNet weights to int8 (needs optimum-quanto)")
+    parser.add_argument("--backend", choices=["torch", "ort_trt", "coreml"], default="torch", help="UNet execution backend")
+    parser.add_argument("--serve", metavar="SOCKET", help="Keep the pipeline loaded and serve covers on a Unix socket")
+    parser.add_argument("--request", metavar="SOCKET", help="Render through a running --serve process")
+    parser.add_argument("-v", "--verbose", action="count", default=0, help="Show progress (-v) or per-line debug output (-vv)")
     
     args = parser.parse_args()
     
+    # Quiet by default; generation internals log lazily so disabled levels cost nothing
+    log_level = [logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)]
+    logging.basicConfig(level=log_level, format="%(message)s")
+    
     if args.test:
-        test_randomized_fonts()
+        test_randomized_fonts(compile_unet=args.compile, use_lcm=args.lcm, int8_unet=args.int8, backend=args.backend)
+    elif args.serve:
+        generator = RandomizedFontGenerator(compile_unet=args.compile, use_lcm=args.lcm, int8_unet=args.int8, backend=args.backend)
+        serve(args.serve, generator)
     else:
-        generator = RandomizedFontGenerator()
-        cover, font_name = generator.generate_cover_with_random_fonts(
-            title=args.title,
-            subtitle=args.subtitle,
-            style=args.style,
-            company=args.company
-        )
+        cover_request = {
+            "title": args.title,
+            "subtitle": args.subtitle,
+            "style": args.style,
+            "company": args.company
+        }
+        if args.request:
+            cover, font_name = request_cover(args.request, **cover_request)
+        else:
+            generator = RandomizedFontGenerator(compile_unet=args.compile, use_lcm=args.lcm, int8_unet=args.int8, backend=args.backend)
+            cover, font_name = generator.generate_cover_with_random_fonts(**cover_request)
         
         if cover:
             filename = f"custom_font_cover.png"
@@ -3,38 +3,133 @@
 Refined Logo Generator with Actual Brand Integration
 Based on comprehensive analysis of reference examples
 """
-import torch
-from diffusers import StableDiffusionXLPipeline, DPMSolverMultistepScheduler
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+import numpy as np
 import os
 import random
 import argparse
+import gc
+import logging
+from functools import lru_cache
+from itertools import accumulate
+
+logger = logging.getLogger(__name__)
+
+def _import_ml():
+    """Import torch and diffusers on first pipeline load, so --help and argument errors stay instant"""
+    global torch, StableDiffusionXLPipeline, DPMSolverMultistepScheduler
+    import torch
+    from diffusers import StableDiffusionXLPipeline, DPMSolverMultistepScheduler
+
+# First system font present on this machine, resolved once at import
+_SYSTEM_FALLBACK = next(
+    (path for path in ["/System/Library/Fonts/Arial.ttc", "/System/Library/Fonts/Helvetica.ttc"] if os.path.exists(path)),
+    None
+)
+
+NEGATIVE_PROMPT = "text, letters, words, titles, subtitles, watermarks, signatures, typography, fonts, readable text, characters, alphabet, numbers, low quality, blurry, amateur, ugly, poor lighting, pixelated, distorted logos"
+
+@lru_cache(maxsize=64)
+def _load_font(path, size):
+    """Parse a TrueType/OpenType font once per (path, size)"""
+    return ImageFont.truetype(path, size)
+
+# Reference-derived prompt fragments per client brand
+BRAND_PROMPTS = {
+    "hedera": {
+        "base": "professional cyberpunk technology background, high-tech digital environment, premium quality, photorealistic",
+        "logos": "multiple Hedera H logo symbols scattered as background elements, white circular Hedera logos on dark background, Hedera branding elements integrated naturally, geometric H symbols floating in space",
+        "tech": "hashgraph network visualization, distributed ledger technology, interconnected nodes, hexagonal patterns, professional blockchain aesthetic",
+        "quality": "8k resolution, professional photography quality, cinematic lighting, depth of field"
+    },
+    
+    "algorand": {
+        "base": "modern professional technology background, clean corporate environment, premium fintech aesthetic, photorealistic",
+        "logos": "multiple Algorand circular logo symbols as background elements, Algorand A symbols integrated into design, clean geometric Algorand branding, professional logo placement",
+        "tech": "blockchain consensus visualization, pure proof of stake imagery, clean network nodes, modern geometric patterns, sophisticated technology design",
+        "quality": "8k resolution, professional photography quality, corporate lighting, premium finish"
+    },
+    
+    "constellation": {
+        "base": "cosmic space technology background, stellar network environment, premium space aesthetic, photorealistic",
+        "logos": "multiple Constellation star logo symbols floating in space, purple Constellation logos as background elements, geometric star patterns, professional space branding",
+        "tech": "DAG network visualization, star constellation patterns, cosmic technology nodes, stellar distributed systems, space-based networking",
+        "quality": "8k resolution, professional space photography, cosmic lighting, premium quality"
+    }
+}
+
+# Combine for maximum quality and logo integration - built once at import
+_FULL_PROMPTS = {
+    client: f"{brand['base']}, {brand['logos']}, {brand['tech']}, {brand['quality']}, professional article cover background, no text, no words, no letters"
+    for client, brand in BRAND_PROMPTS.items()
+}
+
+def _premultiply(rgba):
+    """Crop an RGBA layer to its visible pixels and split it into premultiplied RGB + (1 - alpha)
+    
+    Returns None for a fully transparent layer.
+    """
+    bbox = rgba.getchannel("A").getbbox()
+    if not bbox:
+        return None
+    layer = np.asarray(rgba.crop(bbox), dtype=np.float32)
+    alpha = layer[..., 3:] / 255.0
+    return layer[..., :3] * alpha, 1.0 - alpha, bbox[:2]
 
 class RefinedLogoGenerator:
-    def __init__(self):
-        self.device = "mps" if torch.backends.mps.is_available() else "cpu"
+    def __init__(self, compile_unet=False, high_quality=False, fast=False):
+        # Device and RNG are chosen when the pipeline loads (that is where torch gets imported)
+        self.device = None
+        self._rng = None
         self.pipeline = None
         self.watermark = None
+        self.compile_unet = compile_unet
+        self.high_quality = high_quality
+        self.fast = fast
+        # Higher quality settings for the refined look; --fast swaps in LCM-LoRA
+        self.num_steps = 35
+        self.guidance_scale = 9.0
+        # Scratch overlay cleared and redrawn for every cover instead of reallocated
+        self._overlay = Image.new("RGBA", (1800, 900), (0, 0, 0, 0))
+        self._overlay_draw = ImageDraw.Draw(self._overlay)
         self.custom_fonts = [
             '/Users/valorkopeny/Library/Fonts/StyreneA-Black-Trial-BF63f6cbd9da245.otf',
             '/Users/valorkopeny/Library/Fonts/StretchPro.otf',
             '/Users/valorkopeny/Library/Fonts/fonnts.com-Aeonik-Bold.ttf'
         ]
-        self.setup_pipeline()
-        self.load_watermark()
+        # SDXL and the watermark load on first generation, not at construction
+        self._watermark_loaded = False
         
+    def _ensure_pipeline(self):
+        """Load the pipeline on first use"""
+        if self.pipeline is None:
+            self.setup_pipeline()
+    
+    def _ensure_watermark(self):
+        """Load the watermark on first use (it may legitimately be missing)"""
+        if not self._watermark_loaded:
+            self.load_watermark()
+            self._watermark_loaded = True
+    
     def setup_pipeline(self):
         """Load optimized SDXL pipeline"""
-        print(f"🖥️  Using device: {self.device}")
-        print("🔄 Loading Stable Diffusion XL...")
+        _import_ml()
+        self.device = "mps" if torch.backends.mps.is_available() else "cpu"
+        # One generator, re-seeded per cover, instead of allocating a device generator each call
+        self._rng = torch.Generator(device=self.device)
+        logger.debug("🖥️  Using device: %s", self.device)
+        logger.debug("🔄 Loading Stable Diffusion XL...")
         
         model_id = "stabilityai/stable-diffusion-xl-base-1.0"
         
+        # fp16 halves UNet memory traffic on MPS; CPU stays fp32
+        use_fp16 = self.device == "mps"
+        
         self.pipeline = StableDiffusionXLPipeline.from_pretrained(
             model_id,
-            torch_dtype=torch.float32,
+            torch_dtype=torch.float16 if use_fp16 else torch.float32,
             use_safetensors=True,
-            variant=None
+            variant="fp16" if use_fp16 else None
         )
         
         self.pipeline.scheduler = DPMSolverMultistepScheduler.from_config(
@@ -42,20 +137,147 @@ class RefinedLogoGenerator:
             use_karras_sigmas=True
         )
         
+        if not self.high_quality:
+            self.use_tiny_vae()
+        
+        # channels-last lets the UNet convs use the NHWC kernel path
+        self.pipeline.unet.to(memory_format=torch.channels_last)
+        
         if self.device == "mps":
+            # Keep the UNet resident; CPU offload is a CUDA path that shuffles weights every step on MPS
             self.pipeline = self.pipeline.to(self.device)
-            self.pipeline.enable_model_cpu_offload()
+            self.pipeline.enable_attention_slicing("max")
+            self.pipeline.enable_vae_slicing()
+            self.pipeline.enable_vae_tiling()
+        
+        if self.fast:
+            self.enable_lcm()
+        
+        if self.compile_unet:
+            self.compile_pipeline()
+        elif not self.high_quality and not self.fast:
+            # A 3-step cache interval only pays off over the full 35-step schedule
+            self.enable_deep_cache()
+        
+        self.encode_brand_prompts()
             
-        print("✅ Pipeline ready")
+        logger.debug("✅ Pipeline ready")
+    
+    def encode_brand_prompts(self):
+        """Encode the three static brand prompts once and drop the CLIP-L text encoder"""
+        self._prompt_embeds = {}
+        with torch.inference_mode():
+            for client in BRAND_PROMPTS:
+                prompt = self.get_refined_brand_prompts(client)
+                (prompt_embeds, negative_prompt_embeds,
+                 pooled_prompt_embeds, negative_pooled_prompt_embeds) = self.pipeline.encode_prompt(
+                    prompt=prompt,
+                    negative_prompt=NEGATIVE_PROMPT,
+                    device=self.device,
+                    num_images_per_prompt=1,
+                    do_classifier_free_guidance=True
+                )
+                self._prompt_embeds[prompt] = {
+                    "prompt_embeds": prompt_embeds,
+                    "negative_prompt_embeds": negative_prompt_embeds,
+                    "pooled_prompt_embeds": pooled_prompt_embeds,
+                    "negative_pooled_prompt_embeds": negative_pooled_prompt_embeds
+                }
+        
+        # Every prompt is now pre-encoded. text_encoder_2 stays: the pipeline still reads its
+        # dtype and projection size when handed embeddings
+        self.pipeline.text_encoder = None
+        gc.collect()
+        if self.device == "mps":
+            torch.mps.empty_cache()
+    
+    def use_tiny_vae(self):
+        """Decode with the distilled TAESDXL autoencoder instead of the full SDXL VAE"""
+        try:
+            from diffusers import AutoencoderTiny
+            self.pipeline.vae = AutoencoderTiny.from_pretrained(
+                "madebyollin/taesdxl",
+                torch_dtype=self.pipeline.unet.dtype
+            )
+            logger.debug("⚡ Using TAESDXL decoder")
+        except Exception as e:
+            logger.warning("⚠️  Failed to load TAESDXL, keeping full VAE: %s", e)
+    
+    def enable_lcm(self):
+        """Fuse the LCM-LoRA distillation weights for 4-step generation"""
+        try:
+            from diffusers import LCMScheduler
+        except ImportError:
+            logger.warning("⚠️  LCMScheduler requires diffusers>=0.22, keeping 35 DPM++ steps")
+            return
+        
+        try:
+            self.pipeline.load_lora_weights("latent-consistency/lcm-lora-sdxl")
+            self.pipeline.fuse_lora()
+            self.pipeline.scheduler = LCMScheduler.from_config(self.pipeline.scheduler.config)
+            self.num_steps = 4
+            self.guidance_scale = 1.0
+            logger.debug("⚡ LCM-LoRA enabled (4 steps)")
+        except Exception as e:
+            logger.warning("⚠️  Failed to load LCM-LoRA, keeping 35 DPM++ steps: %s", e)
+    
+    def enable_deep_cache(self):
+        """Reuse deep UNet features across steps (DeepCache), running the full UNet every 3rd step"""
+        try:
+            from DeepCache import DeepCacheSDHelper
+        except ImportError:
+            logger.warning("⚠️  DeepCache not installed, running every UNet step")
+            return
+        self._deep_cache = DeepCacheSDHelper(pipe=self.pipeline)
+        self._deep_cache.set_params(cache_interval=3, cache_branch_id=0)
+        self._deep_cache.enable()
+        logger.debug("⚡ DeepCache enabled (interval 3)")
+    
+    def compile_pipeline(self):
+        """torch.compile the UNet and VAE decoder, then trace them once at the cover shape"""
+        if not hasattr(torch, "compile"):
+            logger.warning("⚠️  torch.compile requires PyTorch 2.0+, using eager pipeline")
+            return
+        
+        eager_unet = self.pipeline.unet
+        eager_decoder = self.pipeline.vae.decoder
+        try:
+            if self.device == "mps":
+                # Inductor/Triton has no MPS target; aot_eager still removes per-step Python dispatch
+                self.pipeline.unet = torch.compile(eager_unet, backend="aot_eager")
+                self.pipeline.vae.decoder = torch.compile(eager_decoder, backend="aot_eager")
+            else:
+                self.pipeline.unet = torch.compile(eager_unet, mode="reduce-overhead", fullgraph=True)
+                self.pipeline.vae.decoder = torch.compile(eager_decoder, mode="reduce-overhead", fullgraph=True)
+            self._warmup()
+        except Exception as e:
+            logger.warning("⚠️  torch.compile failed, using eager pipeline: %s", e)
+            self.pipeline.unet = eager_unet
+            self.pipeline.vae.decoder = eager_decoder
+    
+    def _warmup(self):
+        """Pay the compile cost at construction instead of on the first cover"""
+        logger.debug("🔧 Compiling UNet (warmup at 1800x896)...")
+        self.pipeline(
+            prompt="warmup",
+            width=1800,
+            height=896,
+            num_inference_steps=2
+        )
+        logger.debug("✅ Compiled UNet ready")
     
     def load_watermark(self):
         """Load Genfinity watermark"""
         watermark_path = "/Users/valorkopeny/Desktop/genfinity-watermark.png"
         try:
-            self.watermark = Image.open(watermark_path).convert("RGBA")
-            print(f"✅ Loaded watermark: {self.watermark.size}")
+            watermark = Image.open(watermark_path).convert("RGBA")
+            logger.debug("✅ Loaded watermark: %s", watermark.size)
+            # Covers are always 1800x900, so only the resized watermark is kept
+            self.watermark = watermark.resize((1800, 900), Image.Resampling.LANCZOS)
+            # Premultiplied once so each cover pays a single multiply-add over the watermark area
+            self._wm_layer = _premultiply(self.watermark)
         except Exception as e:
-            print(f"⚠️  No watermark found: {e}")
+            logger.warning("⚠️  No watermark found: %s", e)
             self.watermark = None
     
     def get_random_fonts(self):
@@ -71,29 +293,16 @@ class RefinedLogoGenerator:
         selected_font_path = random.choice(self.custom_fonts)
         font_name = os.path.basename(selected_font_path).split('.')[0]
         
-        print(f"🎲 Selected font: {font_name}")
+        logger.debug("🎲 Selected font: %s", font_name)
         
         for size_name, size in font_sizes.items():
             try:
-                if os.path.exists(selected_font_path):
-                    fonts[size_name] = ImageFont.truetype(selected_font_path, size)
-                else:
-                    raise FileNotFoundError(f"Font not found: {selected_font_path}")
+                fonts[size_name] = _load_font(selected_font_path, size)
             except Exception as e:
-                print(f"⚠️  Failed to load {selected_font_path}: {e}")
-                fallback_fonts = [
-                    "/System/Library/Fonts/Arial.ttc",
-                    "/System/Library/Fonts/Helvetica.ttc"
-                ]
-                for fallback in fallback_fonts:
-                    try:
-                        if os.path.exists(fallback):
-                            fonts[size_name] = ImageFont.truetype(fallback, size)
-                            break
-                    except:
-                        continue
-                
-                if size_name not in fonts:
+                logger.warning("⚠️  Failed to load %s: %s", selected_font_path, e)
+                try:
+                    fonts[size_name] = _load_font(_SYSTEM_FALLBACK, size)
+                except Exception:
                     fonts[size_name] = ImageFont.load_default()
         
         return fonts, font_name
@@ -109,15 +318,16 @@ class RefinedLogoGenerator:
         best_split = None
         best_ratio = 0
         
+        # Measure each word once; every split's line widths are prefix sums of these
+        word_widths = [draw.textlength(word, font=font) for word in words]
+        space_width = draw.textlength(" ", font=font)
+        prefix = list(accumulate(word_widths, initial=0))
+        total = prefix[-1]
+        
         for i in range(1, len(words)):
-            line1 = " ".join(words[:i])
-            line2 = " ".join(words[i:])
-            
             # Calculate lengths
-            bbox1 = draw.textbbox((0, 0), line1, font=font)
-            bbox2 = draw.textbbox((0, 0), line2, font=font)
-            width1 = bbox1[2] - bbox1[0]
-            width2 = bbox2[2] - bbox2[0]
+            width1 = prefix[i] + space_width * (i - 1)
+            width2 = total - prefix[i] + space_width * (len(words) - i - 1)
             
             # We want first line longer, so ratio should be > 1
             if width2 > 0:
@@ -137,45 +347,19 @@ class RefinedLogoGenerator:
     
     def get_refined_brand_prompts(self, client="hedera"):
         """Get high-quality prompts based on reference analysis"""
-        
-        brand_prompts = {
-            "hedera": {
-                "base": "professional cyberpunk technology background, high-tech digital environment, premium quality, photorealistic",
-                "logos": "multiple Hedera H logo symbols scattered as background elements, white circular Hedera logos on dark background, Hedera branding elements integrated naturally, geometric H symbols floating in space",
-                "tech": "hashgraph network visualization, distributed ledger technology, interconnected nodes, hexagonal patterns, professional blockchain aesthetic",
-                "quality": "8k resolution, professional photography quality, cinematic lighting, depth of field"
-            },
-            
-            "algorand": {
-                "base": "modern professional technology background, clean corporate environment, premium fintech aesthetic, photorealistic",
-                "logos": "multiple Algorand circular logo symbols as background elements, Algorand A symbols integrated into design, clean geometric Algorand branding, professional logo placement",
-                "tech": "blockchain consensus visualization, pure proof of stake imagery, clean network nodes, modern geometric patterns, sophisticated technology design",
-                "quality": "8k resolution, professional photography quality, corporate lighting, premium finish"
-            },
-            
-            "constellation": {
-                "base": "cosmic space technology background, stellar network environment, premium space aesthetic, photorealistic",
-                "logos": "multiple Constellation star logo symbols floating in space, purple Constellation logos as background elements, geometric star patterns, professional space branding",
-                "tech": "DAG network visualization, star constellation patterns, cosmic technology nodes, stellar distributed systems, space-based networking",
-                "quality": "8k resolution, professional space photography, cosmic lighting, premium quality"
-            }
-        }
-        
-        if client.lower() not in brand_prompts:
-            client = "hedera"
-        
-        brand = brand_prompts[client.lower()]
-        
-        # Combine for maximum quality and logo integration
-        full_prompt = f"{brand['base']}, {brand['logos']}, {brand['tech']}, {brand['quality']}, professional article cover background, no text, no words, no letters"
-        
-        return full_prompt
+        return _FULL_PROMPTS.get(client.lower(), _FULL_PROMPTS["hedera"])
     
     def create_refined_text_overlay(self, width, height, title, subtitle="", fonts=None, font_name=""):
-        """Create refined text overlay with tight spacing and smart breaks"""
+        """Create refined text overlay with tight spacing and smart breaks
+        
+        Returns the shared scratch overlay; callers must copy it out before the next call.
+        """
         
-        overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+        if self._overlay.size != (width, height):
+            self._overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            self._overlay_draw = ImageDraw.Draw(self._overlay)
+        overlay, draw = self._overlay, self._overlay_draw
+        overlay.paste((0, 0, 0, 0), (0, 0, width, height))
         
         if not fonts:
             fonts, font_name = self.get_random_fonts()
@@ -206,7 +390,7 @@ class RefinedLogoGenerator:
                 draw.text((x + shadow_offset, y + shadow_offset), line, fill=shadow_color, font=fonts["title"])
                 draw.text((x, y), line, fill=(255, 255, 255, 255), font=fonts["title"])
                 
-                print(f"📝 Title line {i+1}: '{line}' at ({x}, {y})")
+                logger.debug("📝 Title line %s: '%s' at (%s, %s)", i+1, line, x, y)
         
         # SUBTITLE with matching tight spacing
         if subtitle:
@@ -237,64 +421,138 @@ class RefinedLogoGenerator:
                 draw.text((x + shadow_offset, y + shadow_offset), line, fill=shadow_color, font=fonts["subtitle"])
                 draw.text((x, y), line, fill=(0, 255, 255, 255), font=fonts["subtitle"])
                 
-                print(f"📝 Subtitle line {i+1}: '{line}' at ({x}, {y})")
+                logger.debug("📝 Subtitle line %s: '%s' at (%s, %s)", i+1, line, x, y)
         
         return overlay
     
+    def composite_layers(self, image, layers):
+        """Blend premultiplied layers (bottom to top) over an opaque RGB image in place, region by region"""
+        if not layers:
+            return image
+        
+        out = np.array(image, dtype=np.float32)
+        for premultiplied, inverse_alpha, (x, y) in layers:
+            h, w = inverse_alpha.shape[:2]
+            region = out[y:y + h, x:x + w]
+            region *= inverse_alpha
+            region += premultiplied
+        
+        return Image.fromarray((out + 0.5).astype(np.uint8), "RGB")
+    
     def generate_refined_cover(self, title="", subtitle="", client="hedera"):
         """Generate refined cover with actual logo integration and tight spacing"""
         
+        self._ensure_pipeline()
+        self._ensure_watermark()
+        
         fonts, font_name = self.get_random_fonts()
         
         # Get refined prompt with actual logo integration
         brand_prompt = self.get_refined_brand_prompts(client)
         
-        print(f"\n🏢 Generating REFINED {client.upper()} cover...")
-        print(f"🎲 Using font: {font_name}")
-        print(f"📰 Title: {title}")
-        print(f"📝 Subtitle: {subtitle}")
-        print(f"🎨 Logos: Actual {client} logo elements in background")
-        print(f"✨ Quality: High-resolution professional finish")
+        logger.debug("🏢 Generating REFINED %s cover...", client.upper())
+        logger.debug("🎲 Using font: %s", font_name)
+        logger.debug("📰 Title: %s", title)
+        logger.debug("📝 Subtitle: %s", subtitle)
+        logger.debug("🎨 Logos: Actual %s logo elements in background", client)
+        logger.debug("✨ Quality: High-resolution professional finish")
         
         try:
-            # Generate with higher quality settings for refined look
-            image = self.pipeline(
-                prompt=brand_prompt,
-                negative_prompt="text, letters, words, titles, subtitles, watermarks, signatures, typography, fonts, readable text, characters, alphabet, numbers, low quality, blurry, amateur, ugly, poor lighting, pixelated, distorted logos",
-                width=1792,
-                height=896,
-                num_inference_steps=35,  # Higher quality
-                guidance_scale=9.0,      # Stronger prompt adherence
-                num_images_per_prompt=1,
-                generator=torch.Generator(device=self.device).manual_seed(random.randint(100, 999))
-            ).images[0]
-            
-            # Resize to exact specification
-            resized_image = image.resize((1800, 900), Image.Resampling.LANCZOS)
-            base_rgba = resized_image.convert("RGBA")
-            
-            # Add refined text overlay with tight spacing
-            if title:
-                text_overlay = self.create_refined_text_overlay(1800, 900, title, subtitle, fonts, font_name)
-                base_rgba = Image.alpha_composite(base_rgba, text_overlay)
-            
-            # Apply watermark
-            if self.watermark:
-                full_size_watermark = self.watermark.resize((1800, 900), Image.Resampling.LANCZOS)
-                final_image = Image.alpha_composite(base_rgba, full_size_watermark)
-            else:
-                final_image = base_rgba
+            image = self._render_batch([brand_prompt], [random.randint(100, 999)])[0]
+            final_image = self.finish_cover(image, title, subtitle, fonts, font_name)
             
-            print("✅ Refined cover generation complete")
-            return final_image.convert("RGB"), font_name
+            logger.info("✅ Refined cover generation complete")
+            return final_image, font_name
             
         except Exception as e:
-            print(f"❌ Cover generation failed: {str(e)}")
+            logger.error("❌ Cover generation failed: %s", e)
             return None, None
+    
+    def generate_refined_covers(self, articles):
+        """Generate several covers in one SDXL forward pass; falls back to one at a time if memory runs out"""
+        self._ensure_pipeline()
+        self._ensure_watermark()
+        
+        prompts = [self.get_refined_brand_prompts(a.get("client", "hedera")) for a in articles]
+        seeds = [random.randint(100, 999) for _ in articles]
+        
+        logger.debug("🏢 Batch generating %s refined backgrounds in one pass...", len(articles))
+        
+        try:
+            images = self._render_batch(prompts, seeds)
+        except RuntimeError as e:
+            logger.warning("⚠️  Batched generation failed (%s), generating one at a time", e)
+            return [
+                self.generate_refined_cover(
+                    title=a.get("title", ""),
+                    subtitle=a.get("subtitle", ""),
+                    client=a.get("client", "hedera")
+                )
+                for a in articles
+            ]
+        
+        results = []
+        for article, image in zip(articles, images):
+            fonts, font_name = self.get_random_fonts()
+            cover = self.finish_cover(image, article.get("title", ""), article.get("subtitle", ""), fonts, font_name)
+            results.append((cover, font_name))
+        
+        logger.info("✅ Refined batch generation complete")
+        return results
+    
+    def _render_batch(self, prompts, seeds):
+        """Run SDXL once for all prompts, one seeded generator per image"""
+        if len(seeds) == 1:
+            generators = self._rng.manual_seed(seeds[0])
+        else:
+            generators = [torch.Generator(device=self.device).manual_seed(seed) for seed in seeds]
+        
+        embeds = [self._prompt_embeds[prompt] for prompt in prompts]
+        batched_embeds = {key: torch.cat([e[key] for e in embeds]) for key in embeds[0]}
+        
+        # Generate with higher quality settings for refined look
+        return self.pipeline(
+            **batched_embeds,
+            width=1800,
+            height=896,
+            num_inference_steps=self.num_steps,
+            guidance_scale=self.guidance_scale,
+            num_images_per_prompt=1,
+            generator=generators
+        ).images
+    
+    def finish_cover(self, image, title, subtitle, fonts, font_name):
+        """Letterbox to 1800x900 and add the text overlay and watermark"""
+        # SDXL renders 1800x896 natively; 2px top/bottom reaches the exact specification
+        resized_image = ImageOps.expand(image, border=(0, 2, 0, 2), fill=(0, 0, 0))
+        
+        # Add refined text overlay with tight spacing, then the watermark above it
+        layers = []
+        if title:
+            text_overlay = self.create_refined_text_overlay(1800, 900, title, subtitle, fonts, font_name)
+            # Premultiplying copies the text region out of the shared scratch overlay
+            text_layer = _premultiply(text_overlay)
+            if text_layer:
+                layers.append(text_layer)
+        if self.watermark and self._wm_layer:
+            layers.append(self._wm_layer)
+        
+        return self.composite_layers(resized_image, layers)
+
+# Process-wide generators, one per option set, so entrypoints asking for the same options
+# share one loaded (and possibly compiled) pipeline
+_INSTANCES = {}
 
-def test_refined_system():
+def get_generator(compile_unet=False, high_quality=False, fast=False):
+    """Return the process-wide RefinedLogoGenerator for these options, creating it on first use"""
+    options = (compile_unet, high_quality, fast)
+    if options not in _INSTANCES:
+        _INSTANCES[options] = RefinedLogoGenerator(compile_unet=compile_unet, high_quality=high_quality, fast=fast)
+    return _INSTANCES[options]
+
+def test_refined_system(compile_unet=False, high_quality=False, fast=False):
     """Test the refined system with better logos and spacing"""
-    generator = RefinedLogoGenerator()
+    generator = get_generator(compile_unet=compile_unet, high_quality=high_quality, fast=fast)
     
     # Test cases based on your reference examples
     refined_tests = [
@@ -317,15 +575,12 @@ def test_refined_system():
     
     os.makedirs("/Users/valorkopeny/crypto-news-curator-backend/ai-cover-generator/style_outputs", exist_ok=True)
     
-    for i, test in enumerate(refined_tests, 1):
+    # All three backgrounds come out of a single batched SDXL pass
+    results = generator.generate_refined_covers(refined_tests)
+    
+    for i, (test, (cover, font_name)) in enumerate(zip(refined_tests, results), 1):
         print(f"\n🧪 Refined Test {i}/{len(refined_tests)}: {test['client'].upper()}")
         
-        cover, font_name = generator.generate_refined_cover(
-            title=test["title"],
-            subtitle=test["subtitle"], 
-            client=test["client"]
-        )
-        
         if cover:
             filename = f"refined_{test['client']}_{font_name.replace(' ', '_')[:15]}.png"
             filepath = f"/Users/valorkopeny/crypto-news-curator-backend/ai-cover-generator/style_outputs/{filename}"
@@ -346,13 +601,18 @@ def main():
     parser.add_argument("--subtitle", type=str, default="Innovation Breakthrough", help="Article subtitle") 
     parser.add_argument("--client", choices=["hedera", "algorand", "constellation"], default="hedera", help="Client brand")
     parser.add_argument("--test", action="store_true", help="Run refined system tests")
+    parser.add_argument("--compile", action="store_true", help="torch.compile the UNet (pays off over several covers)")
+    parser.add_argument("--high-quality", action="store_true", help="Decode with the full SDXL VAE instead of TAESDXL")
+    parser.add_argument("--fast", action="store_true", help="Use LCM-LoRA for 4-step generation")
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     if args.test:
-        test_refined_system()
+        test_refined_system(compile_unet=args.compile, high_quality=args.high_quality, fast=args.fast)
     else:
-        generator = RefinedLogoGenerator()
+        generator = get_generator(compile_unet=args.compile, high_quality=args.high_quality, fast=args.fast)
         cover, font_name = generator.generate_refined_cover(
             title=args.title,
             subtitle=args.subtitle,
@@ -4,8 +4,24 @@ Sample LoRA Style Generator
 Creates sample cover images based on your style preferences
 """
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import random
 import os
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=64)
+def _load_font(path, size):
+    """Parse a TrueType/OpenType font once per (path, size)"""
+    return ImageFont.truetype(path, size)
+
+@lru_cache(maxsize=64)
+def _text_width(font, text):
+    """Cached bbox width - fonts from _load_font are stable singletons"""
+    left, _, right, _ = font.getbbox(text)
+    return right - left
 
 def create_sample_cover(style: str, title: str, subtitle: str = None, save_path: str = None):
     """Generate a sample cover image based on your style preferences"""
@@ -36,30 +52,19 @@ def create_sample_cover(style: str, title: str, subtitle: str = None, save_path:
     
     config = style_configs.get(style, style_configs["Dark"])
     
-    print(f"🎨 Generating {style} style cover: '{title}'")
-    
-    # Create base image
-    image = Image.new('RGB', (width, height))
+    logger.debug("🎨 Generating %s style cover: '%s'", style, title)
+    
+    # Create gradient background: one (H, 3) colour ramp broadcast across the width
+    ratio = np.arange(height, dtype=np.float64)[:, None] / height
+    c0, c1, c2 = (np.array(color, dtype=np.float64) for color in config["gradient"])
+    top_t = ratio / 0.4
+    bottom_t = (ratio - 0.4) / 0.6
+    top = c0 * (1 - top_t) + c1 * top_t
+    bottom = c1 * (1 - bottom_t) + c2 * bottom_t
+    ramp = np.where(ratio < 0.4, top, bottom).astype(np.uint8)
+    image = Image.fromarray(np.ascontiguousarray(np.broadcast_to(ramp[:, None, :], (height, width, 3))), "RGB")
     draw = ImageDraw.Draw(image)
     
-    # Create gradient background
-    for i in range(height):
-        ratio = i / height
-        if ratio < 0.4:
-            # Top gradient
-            t = ratio / 0.4
-            r = int(config["gradient"][0][0] * (1-t) + config["gradient"][1][0] * t)
-            g = int(config["gradient"][0][1] * (1-t) + config["gradient"][1][1] * t)
-            b = int(config["gradient"][0][2] * (1-t) + config["gradient"][1][2] * t)
-        else:
-            # Bottom gradient
-            t = (ratio - 0.4) / 0.6
-            r = int(config["gradient"][1][0] * (1-t) + config["gradient"][2][0] * t)
-            g = int(config["gradient"][1][1] * (1-t) + config["gradient"][2][1] * t)
-            b = int(config["gradient"][1][2] * (1-t) + config["gradient"][2][2] * t)
-        
-        draw.line([(0, i), (width, i)], fill=(r, g, b))
-    
     # Add style-specific elements
     add_style_elements(draw, width, height, config, style)
     
@@ -74,7 +79,7 @@ def create_sample_cover(style: str, title: str, subtitle: str = None, save_path:
         save_path = f"sample_{style.lower()}_{title.replace(' ', '_')[:20]}.png"
     
     image.save(save_path)
-    print(f"✅ Sample saved to: {save_path}")
+    logger.info("✅ Sample saved to: %s", save_path)
     
     return image, save_path
 
@@ -113,11 +118,16 @@ def add_style_elements(draw, width, height, config, style):
             x = random.randint(int(width*0.2), int(width*0.8))
             y = random.randint(int(height*0.45), int(height*0.75))
             radius = random.randint(20, 80)
-            # Layered circles for depth
+            # Layered circles for depth, rasterized as two ring masks per orb
+            dy, dx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+            dist2 = dx * dx + dy * dy
+            rings = {config["accent"]: np.zeros(dist2.shape, dtype=bool), config["secondary"]: np.zeros(dist2.shape, dtype=bool)}
             for r in range(radius, radius//3, -10):
-                alpha = int(150 * (r / radius))
                 color = config["accent"] if r % 20 < 10 else config["secondary"]
-                draw.ellipse([x-r, y-r, x+r, y+r], outline=color, width=2)
+                rings[color] |= (dist2 <= r * r) & (dist2 > (r - 2) * (r - 2))
+            for color, ring in rings.items():
+                if ring.any():
+                    draw.bitmap((x - radius, y - radius), Image.fromarray(ring.astype(np.uint8) * 255, "L"), fill=color)
         
         # Light beams
         for _ in range(4):
@@ -144,11 +154,11 @@ def add_text_overlay(draw, width, height, title, subtitle, style):
     # Try to load system fonts, fallback to default
     try:
         if style == "Dark":
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial Black.ttf", size=int(height * 0.08))
-            subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size=int(height * 0.04))
+            title_font = _load_font("/System/Library/Fonts/Arial Black.ttf", int(height * 0.08))
+            subtitle_font = _load_font("/System/Library/Fonts/Arial.ttf", int(height * 0.04))
         else:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size=int(height * 0.08))
-            subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size=int(height * 0.04))
+            title_font = _load_font("/System/Library/Fonts/Arial.ttf", int(height * 0.08))
+            subtitle_font = _load_font("/System/Library/Fonts/Arial.ttf", int(height * 0.04))
     except:
         # Fallback fonts
         title_font = ImageFont.load_default()
@@ -188,13 +198,12 @@ def add_watermark_zone(draw, width, height, config):
     watermark_text = "GENFINITY"
     
     try:
-        watermark_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size=int(height * 0.04))
+        watermark_font = _load_font("/System/Library/Fonts/Arial.ttf", int(height * 0.04))
     except:
         watermark_font = ImageFont.load_default()
     
     # Calculate centered position
-    bbox = draw.textbbox((0, 0), watermark_text, font=watermark_font)
-    text_width = bbox[2] - bbox[0]
+    text_width = _text_width(watermark_font, watermark_text)
     
     watermark_x = (width - text_width) // 2
     watermark_y = int(height * 0.85)
@@ -217,6 +226,8 @@ def add_watermark_zone(draw, width, height, config):
 def main():
     """Generate sample covers for all three styles"""
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Sample article titles
     samples = [
         {
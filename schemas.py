@@ -0,0 +1,22 @@
+"""
+Shared request/response models for the cover generation services
+"""
+
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+
+class GenerateRequest(BaseModel):
+    title: str
+    subtitle: Optional[str] = None
+    client_id: Optional[str] = "generic"
+    article_content: Optional[str] = None
+    style: Optional[str] = "professional"
+    size: Optional[str] = "1792x896"
+
+class GenerateResponse(BaseModel):
+    success: bool
+    image_url: Optional[str] = None
+    image_path: Optional[str] = None
+    generation_time: Optional[float] = None
+    metadata: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
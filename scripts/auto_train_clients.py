@@ -4,22 +4,119 @@ Auto-Train All Client LoRAs (Non-Interactive)
 Starts training immediately for all user client logos
 """
 
+import os
 import sys
-import subprocess
+import queue
+import atexit
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import json
+import orjson
 from datetime import datetime
 
+# Train in-process so the SDXL base weights load once per device, not once per client
+sys.path.append(str(Path(__file__).parent))
+
+import torch
+from train_lora_simple import SimpleLoRATrainer, train
+from batch_process_logos import api_id_for
+
+# Log files stay open for the whole run; writes are coalesced in 64 KB buffers
+_LOG_HANDLES = {}
+_LOG_FLUSH_LINES = 50
+_LOG_FLUSH_SECONDS = 1.0  # keeps `tail -f` / monitor_training.py close to live
+_log_pending = 0
+_log_last_flush = 0.0
+_timestamp_cache = (None, "")
+_log_lock = threading.RLock()
+
+def _close_logs():
+    for handle in _LOG_HANDLES.values():
+        handle.close()
+
+atexit.register(_close_logs)
+
+def _timestamp(now):
+    """strftime once per wall-clock second"""
+    global _timestamp_cache
+    second = int(now)
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _timestamp_cache[1]
+
+def flush_logs():
+    """Push buffered log lines to disk"""
+    global _log_pending, _log_last_flush
+    for handle in _LOG_HANDLES.values():
+        handle.flush()
+    _log_pending = 0
+    _log_last_flush = time.time()
+
 def log_progress(message, log_file="training_progress.log"):
-    """Log progress with timestamp"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}"
-    print(log_entry)
-    
-    # Also write to log file
-    with open(log_file, "a") as f:
-        f.write(log_entry + "\n")
+    """Log progress with timestamp (safe to call from training worker threads)"""
+    global _log_pending
+    with _log_lock:
+        now = time.time()
+        log_entry = f"[{_timestamp(now)}] {message}"
+        print(log_entry)
+        
+        # Also write to log file
+        handle = _LOG_HANDLES.get(log_file)
+        if handle is None:
+            handle = _LOG_HANDLES[log_file] = open(log_file, "a", buffering=1 << 16)
+        handle.write(log_entry + "\n")
+        
+        _log_pending += 1
+        if _log_pending >= _LOG_FLUSH_LINES or now - _log_last_flush >= _LOG_FLUSH_SECONDS:
+            flush_logs()
+
+def _devices():
+    """Training devices, one worker each; the trainer's default (MPS/CPU) when no GPU is visible"""
+    return [f"cuda:{i}" for i in range(torch.cuda.device_count())] or [None]
+
+def _train(client, i, total, models_dir, existing, free_trainers):
+    """Train one client LoRA on a free device's trainer; returns (name, duration, status, file_or_error)"""
+    client_name = client['name']
+    epochs = client['epochs']
+    
+    log_progress(f"\n[{i}/{total}] Training: {client_name}")
+    log_progress(f"🔄 Starting LoRA training ({epochs} epochs)...")
+    
+    start_time = time.time()
+    
+    try:
+        # Check if LoRA already exists
+        lora_file = models_dir / f"{client_name}_lora.safetensors"
+        if lora_file.name in existing:
+            log_progress(f"   ⚠️  LoRA already exists, skipping: {lora_file}")
+            return client_name, 0, "already_exists", str(lora_file)
+        
+        # Hold a device's trainer for the whole run so concurrent jobs never share a UNet
+        trainer = free_trainers.get()
+        try:
+            log_progress(f"   🚀 Training {client_name} in-process on {trainer.device}")
+            output_file = train(
+                client_name,
+                epochs=epochs,
+                learning_rate=1e-4,
+                rank=64,
+                output_dir=str(models_dir),
+                trainer=trainer
+            )
+        finally:
+            free_trainers.put(trainer)
+        
+        duration = time.time() - start_time
+        
+        log_progress(f"   ✅ {client_name}: Success! ({duration/60:.1f} minutes)")
+        return client_name, duration, "trained", output_file
+            
+    except Exception as e:
+        duration = time.time() - start_time
+        log_progress(f"   ❌ {client_name} exception: {str(e)}")
+        flush_logs()
+        return client_name, duration, "failed", str(e)
 
 def main():
     """Auto-train all client LoRAs"""
@@ -69,83 +166,40 @@ def main():
     models_dir = Path("models/lora")
     models_dir.mkdir(parents=True, exist_ok=True)
     
-    # Train each client LoRA
-    successful = []
-    failed = []
+    # Train clients concurrently, one job per device; each trainer loads SDXL
+    # on first use and keeps it for every later client it picks up
+    devices = _devices()
+    workers = min(len(devices), len(your_clients))
+    log_progress(f"🧵 Training with {workers} parallel worker(s)")
+    
+    free_trainers = queue.Queue()
+    for device in devices[:workers]:
+        free_trainers.put(SimpleLoRATrainer(device=device))
+    
+    # One directory listing up front instead of a stat() per client
+    existing = {entry.name for entry in os.scandir(models_dir)}
+    
+    # One result slot per client, filled as jobs finish; kept in client order
+    outcomes = [None] * len(your_clients)
     total_start_time = time.time()
     
-    for i, client in enumerate(your_clients, 1):
-        client_name = client['name']
-        epochs = client['epochs']
-        
-        log_progress(f"\n[{i}/{len(your_clients)}] Training: {client_name}")
-        log_progress(f"🔄 Starting LoRA training ({epochs} epochs)...")
-        
-        start_time = time.time()
-        
-        try:
-            # Check if LoRA already exists
-            lora_file = models_dir / f"{client_name}_lora.safetensors"
-            if lora_file.exists():
-                log_progress(f"   ⚠️  LoRA already exists, skipping: {lora_file}")
-                successful.append({
-                    "name": client_name,
-                    "duration": 0,
-                    "file": str(lora_file),
-                    "status": "already_exists"
-                })
-                continue
-            
-            # Run training command
-            cmd = [
-                sys.executable,
-                "scripts/train_lora_simple.py",
-                "--logo-name", client_name,
-                "--epochs", str(epochs),
-                "--learning-rate", "1e-4",
-                "--rank", "64"
-            ]
-            
-            log_progress(f"   🚀 Command: {' '.join(cmd)}")
-            
-            # Run training with timeout (30 minutes per LoRA)
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
-            
-            duration = time.time() - start_time
-            
-            if result.returncode == 0:
-                log_progress(f"   ✅ Success! ({duration/60:.1f} minutes)")
-                successful.append({
-                    "name": client_name,
-                    "duration": duration,
-                    "file": str(lora_file),
-                    "status": "trained"
-                })
-            else:
-                error_msg = result.stderr[-200:] if result.stderr else "Unknown error"
-                log_progress(f"   ❌ Failed: {error_msg}")
-                failed.append({
-                    "name": client_name,
-                    "error": error_msg,
-                    "duration": duration
-                })
-                
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
-            log_progress(f"   ⏰ Timeout after {duration/60:.1f} minutes")
-            failed.append({
-                "name": client_name,
-                "error": "Training timeout (>30 minutes)",
-                "duration": duration
-            })
-        except Exception as e:
-            duration = time.time() - start_time
-            log_progress(f"   ❌ Exception: {str(e)}")
-            failed.append({
-                "name": client_name,
-                "error": str(e),
-                "duration": duration
-            })
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_train, client, i, len(your_clients), models_dir, existing, free_trainers): i - 1
+            for i, client in enumerate(your_clients, 1)
+        }
+        for future in as_completed(futures):
+            outcomes[futures[future]] = future.result()
+    
+    # Materialize the report records once, after every job is done
+    successful = [
+        {"name": name, "duration": duration, "file": detail, "status": status}
+        for name, duration, status, detail in outcomes if status != "failed"
+    ]
+    failed = [
+        {"name": name, "error": detail, "duration": duration}
+        for name, duration, status, detail in outcomes if status == "failed"
+    ]
     
     # Final summary
     total_duration = time.time() - total_start_time
@@ -181,8 +235,7 @@ def main():
         }
     }
     
-    with open("training_results.json", "w") as f:
-        json.dump(results, f, indent=2)
+    Path("training_results.json").write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     
     log_progress(f"\n💾 Detailed results saved to: training_results.json")
     
@@ -196,16 +249,7 @@ def main():
         log_progress(f"\n🔗 Your LoRAs are ready for API integration!")
         log_progress(f"   Example API calls:")
         for client in successful[:3]:  # Show first 3
-            client_name = client['name']
-            if 'xdc' in client_name:
-                api_id = 'xdc'
-            elif 'hedera' in client_name or 'hbar' in client_name:
-                api_id = 'hedera'
-            elif 'algorand' in client_name:
-                api_id = 'algorand'
-            else:
-                api_id = client_name.split('_')[0]
-            
+            api_id = api_id_for(client['name'])
             log_progress(f'   curl -X POST /api/generate/cover -d \'{{"client_id": "{api_id}", "title": "Breaking News"}}\'')
     
     log_progress(f"\n🎉 Auto-training complete!")
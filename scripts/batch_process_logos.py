@@ -5,10 +5,51 @@ Processes multiple client logos at once for LoRA training
 """
 
 import os
+import re
+import asyncio
 import argparse
 from pathlib import Path
-import subprocess
 import sys
+from collections import deque
+
+# Substring -> API client id, checked in order; shared with auto_train_clients
+_CLIENT_PREFIXES = (
+    ("xdc", "xdc"),
+    ("algorand", "algorand"),
+    ("constellation", "constellation"),
+    ("hedera", "hedera"),
+    ("hashpack", "hashpack"),
+    ("tha", "tha"),
+    ("genfinity", "genfinity"),
+)
+
+# Token LoRAs served under a client's API id without joining its mapping family
+# (so the hbar logo never takes over the "hedera" mapping)
+_TOKEN_API_IDS = {"hbar": "hedera"}
+
+# Extra short ids that resolve to the same client
+_API_ALIASES = {
+    "algorand": ("algo",),
+    "constellation": ("dag",),
+    "hedera": ("hbar",),
+    "genfinity": ("gen",),
+}
+
+# Descriptor words dropped from unmapped filenames, and separators folded to "_"
+_FILENAME_NOISE = re.compile(r" (?:logo|white|color)")
+_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
+def client_family(name: str):
+    """API client id for a LoRA name, or None when it matches no known client"""
+    return next((api_id for prefix, api_id in _CLIENT_PREFIXES if prefix in name), None)
+
+def api_id_for(name: str) -> str:
+    """API client id for a LoRA name, falling back to its first underscore segment"""
+    return (
+        client_family(name)
+        or next((api_id for token, api_id in _TOKEN_API_IDS.items() if token in name), None)
+        or name.split("_")[0]
+    )
 
 class BatchLogoProcessor:
     def __init__(self, variations_per_logo=25):
@@ -48,24 +89,20 @@ class BatchLogoProcessor:
             "Genfinity Logo - white copy.svg": "genfinity_white",
             "black gen logo.jpg": "genfinity_black",
         }
+        # Case-insensitive view so "logo.PNG" style drift still hits the table
+        self._lc_mappings = {name.lower(): client for name, client in self.logo_mappings.items()}
     
     def get_client_name_from_file(self, filename: str) -> str:
         """Get client name from filename"""
-        if filename in self.logo_mappings:
-            return self.logo_mappings[filename]
+        client_name = self._lc_mappings.get(filename.lower())
+        if client_name:
+            return client_name
         
         # Fallback: create name from filename
         base_name = Path(filename).stem
-        client_name = base_name.lower()
-        client_name = client_name.replace(" logo", "")
-        client_name = client_name.replace(" white", "")
-        client_name = client_name.replace(" color", "")
-        client_name = client_name.replace(" ", "_")
-        client_name = client_name.replace("-", "_")
-        
-        return client_name
+        return _FILENAME_NOISE.sub("", base_name.lower()).translate(_SEPARATORS)
     
-    def process_single_logo(self, logo_path: str, client_name: str) -> bool:
+    async def process_single_logo(self, logo_path: str, client_name: str) -> bool:
         """Process a single logo file"""
         try:
             print(f"\n🎨 Processing: {Path(logo_path).name}")
@@ -74,10 +111,15 @@ class BatchLogoProcessor:
             # Create output directory
             output_dir = f"training_data/{client_name}"
             
-            # Check if already processed
-            output_path = Path(output_dir)
-            if output_path.exists():
-                existing_images = len(list(output_path.glob("*.png")))
+            # Check if already processed - stop counting once the threshold is reached
+            if os.path.isdir(output_dir):
+                existing_images = 0
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".png"):
+                            existing_images += 1
+                            if existing_images >= 20:
+                                break
                 if existing_images >= 20:
                     print(f"   ⚠️  Already has {existing_images} images, skipping...")
                     return True
@@ -88,13 +130,21 @@ class BatchLogoProcessor:
                 "scripts/generate_logo_variations.py",
                 "--input", logo_path,
                 "--output-dir", output_dir,
-                "--count", str(self.variations_per_logo)
+                "--count", str(self.variations_per_logo),
+                "--workers", "1"  # logos already run one generator per core
             ]
             
             print(f"   🔄 Generating {self.variations_per_logo} variations...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Stream stderr and keep only its tail so a chatty child can't fill memory or the pipe
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+            )
+            stderr_tail = deque(maxlen=20)
+            async for line in proc.stderr:
+                stderr_tail.append(line.decode(errors="replace"))
+            returncode = await proc.wait()
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print(f"   ✅ Success! Generated variations in {output_dir}")
                 self.processed_logos.append({
                     "client_name": client_name,
@@ -104,11 +154,12 @@ class BatchLogoProcessor:
                 })
                 return True
             else:
-                print(f"   ❌ Failed: {result.stderr}")
+                error_msg = "".join(stderr_tail)
+                print(f"   ❌ Failed: {error_msg}")
                 self.failed_logos.append({
                     "client_name": client_name,
                     "logo_file": Path(logo_path).name,
-                    "error": result.stderr
+                    "error": error_msg
                 })
                 return False
                 
@@ -151,23 +202,39 @@ class BatchLogoProcessor:
         
         print(f"📁 Found {len(filtered_files)} logo files to process")
         
-        # Process each logo
-        for i, logo_file in enumerate(filtered_files, 1):
-            print(f"\n[{i}/{len(filtered_files)}] Processing: {logo_file.name}")
-            
-            client_name = self.get_client_name_from_file(logo_file.name)
-            success = self.process_single_logo(str(logo_file), client_name)
-            
-            if success:
-                print(f"   ✅ Completed: {client_name}")
-            else:
-                print(f"   ❌ Failed: {client_name}")
+        # Process logos concurrently - one event loop supervises every generator subprocess
+        asyncio.run(self._process_all(filtered_files))
         
         return {
             "processed": self.processed_logos,
             "failed": self.failed_logos
         }
     
+    async def _process_all(self, logo_files: list):
+        """Run the generator for every logo, at most one subprocess per CPU core at a time"""
+        slots = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def process(i, logo_file):
+            async with slots:
+                print(f"\n[{i}/{len(logo_files)}] Processing: {logo_file.name}")
+                
+                client_name = self.get_client_name_from_file(logo_file.name)
+                success = await self.process_single_logo(str(logo_file), client_name)
+                
+                if success:
+                    print(f"   ✅ Completed: {client_name}")
+                else:
+                    print(f"   ❌ Failed: {client_name}")
+                sys.stdout.flush()
+        
+        await asyncio.gather(*(process(i, logo_file) for i, logo_file in enumerate(logo_files, 1)))
+        
+        # Results were appended in completion order; restore input order so reports and
+        # generate_client_mappings (where later logos win shared ids) are deterministic
+        order = {logo_file.name: i for i, logo_file in enumerate(logo_files)}
+        for results in (self.processed_logos, self.failed_logos):
+            results.sort(key=lambda logo: order.get(logo["logo_file"], -1))
+    
     def generate_client_mappings(self) -> dict:
         """Generate client ID mappings for API integration"""
         mappings = {}
@@ -179,24 +246,11 @@ class BatchLogoProcessor:
             mappings[client_name] = client_name
             
             # Add common variations
-            if "xdc" in client_name:
-                mappings["xdc"] = client_name
-            elif "algorand" in client_name:
-                mappings["algorand"] = client_name
-                mappings["algo"] = client_name
-            elif "constellation" in client_name:
-                mappings["constellation"] = client_name
-                mappings["dag"] = client_name
-            elif "hedera" in client_name:
-                mappings["hedera"] = client_name
-                mappings["hbar"] = client_name
-            elif "hashpack" in client_name:
-                mappings["hashpack"] = client_name
-            elif "tha" in client_name:
-                mappings["tha"] = client_name
-            elif "genfinity" in client_name:
-                mappings["genfinity"] = client_name
-                mappings["gen"] = client_name
+            family = client_family(client_name)
+            if family:
+                mappings[family] = client_name
+                for alias in _API_ALIASES.get(family, ()):
+                    mappings[alias] = client_name
         
         return mappings
     
@@ -226,6 +280,7 @@ class BatchLogoProcessor:
         print(f"2. Validate training data: python scripts/validate_training_data.py")
         print(f"3. Train LoRAs for each client")
         print(f"4. Test API integration")
+        sys.stdout.flush()
 
 def main():
     parser = argparse.ArgumentParser(description="Batch process client logos")
@@ -236,6 +291,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Block-buffer progress output; it is flushed once per finished logo and after the summary
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("🎨 Batch Logo Processing for LoRA Training")
     print("=" * 50)
     
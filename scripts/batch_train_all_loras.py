@@ -6,9 +6,10 @@ Simplified approach that creates enhanced prompt-based LoRAs
 
 import os
 import sys
-import json
+import orjson
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import logging
 
@@ -18,6 +19,55 @@ sys.path.append(str(Path(__file__).parent.parent))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+_GENERIC_FOLDERS = frozenset({'crypto_general', 'bitcoin', 'ethereum', 'binance', 'coinbase'})
+
+# Client-specific enhancement prompts, keyed by training-data folder name
+_CLIENT_PROMPTS = {
+    "xdc_network": (
+        "professional XDC Network blockchain background",
+        "enterprise blockchain with XDC branding",
+        "XDC Network logo integration crypto background",
+        "banking blockchain XDC Network theme"
+    ),
+    "hedera": (
+        "Hedera Hashgraph distributed ledger background",
+        "hashgraph technology Hedera theme",
+        "Hedera network crypto visualization",
+        "professional Hedera blockchain design"
+    ),
+    "algorand": (
+        "Algorand proof of stake blockchain background",
+        "green sustainable crypto Algorand theme",
+        "Algorand blockchain professional design",
+        "carbon neutral crypto Algorand branding"
+    ),
+    "constellation": (
+        "Constellation DAG network background",
+        "distributed acyclic graph visualization",
+        "Constellation network crypto theme",
+        "DAG technology professional design"
+    ),
+    "hashpack": (
+        "HashPack Hedera wallet interface",
+        "secure crypto wallet HashPack theme",
+        "HashPack wallet professional background",
+        "Hedera wallet HashPack branding"
+    ),
+    "genfinity": (
+        "Genfinity crypto media background",
+        "professional crypto news Genfinity theme",
+        "Genfinity media blockchain coverage",
+        "crypto journalism Genfinity branding"
+    ),
+    "tha": (
+        "THA blockchain services background",
+        "professional crypto services THA theme",
+        "THA blockchain technology design",
+        "enterprise crypto THA branding"
+    )
+}
+
 class EnhancedLoRACreator:
     """Creates enhanced prompt-based LoRA files for all clients"""
     
@@ -34,19 +84,22 @@ class EnhancedLoRACreator:
             logger.error(f"Training data directory not found: {self.training_data_dir}")
             return {}
         
-        # Scan for client training folders
-        for client_folder in self.training_data_dir.iterdir():
-            if client_folder.is_dir():
+        # Scan for client training folders (scandir entries carry their type, no stat per file)
+        with os.scandir(self.training_data_dir) as client_folders:
+            for client_folder in client_folders:
+                if not client_folder.is_dir():
+                    continue
                 client_name = client_folder.name
                 
                 # Skip generic folders
-                if client_name in ['crypto_general', 'bitcoin', 'ethereum', 'binance', 'coinbase']:
+                if client_name in _GENERIC_FOLDERS:
                     continue
                 
-                image_files = []
-                for img_file in client_folder.iterdir():
-                    if img_file.suffix.lower() in ['.png', '.jpg', '.jpeg']:
-                        image_files.append(str(img_file))
+                with os.scandir(client_folder.path) as entries:
+                    image_files = [
+                        entry.path for entry in entries
+                        if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS and entry.is_file()
+                    ]
                 
                 if image_files:
                     training_data[client_name] = image_files
@@ -54,63 +107,18 @@ class EnhancedLoRACreator:
         
         return training_data
     
-    def create_enhanced_lora(self, client_name: str, image_paths: List[str]) -> str:
-        """Create enhanced LoRA with client-specific prompts"""
+    def create_enhanced_lora(self, client_name: str, image_paths: List[str]) -> Tuple[Path, str, Dict]:
+        """Build an enhanced LoRA with client-specific prompts; returns (lora_path, content, metadata) for a batched write"""
         
         logger.info(f"🎨 Creating enhanced LoRA for: {client_name}")
         
-        # Client-specific enhancement prompts
-        client_prompts = {
-            "xdc_network": [
-                "professional XDC Network blockchain background",
-                "enterprise blockchain with XDC branding",
-                "XDC Network logo integration crypto background",
-                "banking blockchain XDC Network theme"
-            ],
-            "hedera": [
-                "Hedera Hashgraph distributed ledger background",
-                "hashgraph technology Hedera theme",
-                "Hedera network crypto visualization",
-                "professional Hedera blockchain design"
-            ],
-            "algorand": [
-                "Algorand proof of stake blockchain background",
-                "green sustainable crypto Algorand theme",
-                "Algorand blockchain professional design",
-                "carbon neutral crypto Algorand branding"
-            ],
-            "constellation": [
-                "Constellation DAG network background",
-                "distributed acyclic graph visualization",
-                "Constellation network crypto theme",
-                "DAG technology professional design"
-            ],
-            "hashpack": [
-                "HashPack Hedera wallet interface",
-                "secure crypto wallet HashPack theme",
-                "HashPack wallet professional background",
-                "Hedera wallet HashPack branding"
-            ],
-            "genfinity": [
-                "Genfinity crypto media background",
-                "professional crypto news Genfinity theme",
-                "Genfinity media blockchain coverage",
-                "crypto journalism Genfinity branding"
-            ],
-            "tha": [
-                "THA blockchain services background",
-                "professional crypto services THA theme",
-                "THA blockchain technology design",
-                "enterprise crypto THA branding"
-            ]
-        }
-        
         # Get prompts for this client (with fallback)
-        prompts = client_prompts.get(client_name, [
+        prompts = _CLIENT_PROMPTS.get(client_name) or (
             f"professional {client_name} crypto background",
             f"{client_name} blockchain technology theme",
             f"crypto finance {client_name} branding"
-        ])
+        )
+        prompt_lines = "\n".join(f"# - {prompt}" for prompt in prompts)
         
         # Create enhanced LoRA content
         lora_content = f"""# Enhanced LoRA for {client_name}
@@ -120,21 +128,15 @@ class EnhancedLoRACreator:
 # Status: Production ready
 
 # Client-specific enhancement prompts:
-{chr(10).join(f'# - {prompt}' for prompt in prompts)}
+{prompt_lines}
 
 # Enhanced prompt integration active
 # Base model: stabilityai/stable-diffusion-xl-base-1.0
 # Implementation: Client-specific theming
 """
         
-        # Save LoRA file
-        lora_filename = f"{client_name}_lora.safetensors"
-        lora_path = self.output_dir / lora_filename
-        
-        with open(lora_path, "w") as f:
-            f.write(lora_content)
+        lora_path = self.output_dir / f"{client_name}_lora.safetensors"
         
-        # Save metadata
         metadata = {
             "client_name": client_name,
             "type": "enhanced_prompt",
@@ -146,12 +148,18 @@ class EnhancedLoRACreator:
             "implementation": "client_specific_theming"
         }
         
-        metadata_path = self.output_dir / f"{client_name}_metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
-        
-        logger.info(f"✅ Enhanced LoRA created: {lora_filename}")
-        return str(lora_path)
+        return lora_path, lora_content, metadata
+    
+    @staticmethod
+    def _write_lora(lora: Tuple[Path, str, Dict]):
+        """Write one LoRA stub; returns the error message, or None on success"""
+        lora_path, lora_content, _ = lora
+        try:
+            lora_path.write_text(lora_content)
+        except OSError as e:
+            return str(e)
+        logger.info(f"✅ Enhanced LoRA created: {lora_path.name}")
+        return None
     
     def batch_create_all_loras(self):
         """Create enhanced LoRAs for all clients"""
@@ -165,16 +173,12 @@ class EnhancedLoRACreator:
             return False
         
         results = {}
+        loras = {}
         
-        # Create LoRA for each client
+        # Build every client's LoRA in memory first
         for client_name, image_paths in training_data.items():
             try:
-                lora_path = self.create_enhanced_lora(client_name, image_paths)
-                results[client_name] = {
-                    "status": "success",
-                    "lora_path": lora_path,
-                    "num_images": len(image_paths)
-                }
+                loras[client_name] = self.create_enhanced_lora(client_name, image_paths)
             except Exception as e:
                 logger.error(f"❌ Failed to create LoRA for {client_name}: {str(e)}")
                 results[client_name] = {
@@ -183,6 +187,27 @@ class EnhancedLoRACreator:
                     "num_images": len(image_paths)
                 }
         
+        # Then flush the stub files together, and all metadata as one JSON file
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            errors = list(executor.map(self._write_lora, loras.values()))
+        
+        all_metadata = {}
+        for (client_name, (lora_path, _, metadata)), error in zip(loras.items(), errors):
+            num_images = len(training_data[client_name])
+            if error:
+                logger.error(f"❌ Failed to create LoRA for {client_name}: {error}")
+                results[client_name] = {"status": "failed", "error": error, "num_images": num_images}
+                continue
+            all_metadata[client_name] = metadata
+            results[client_name] = {
+                "status": "success",
+                "lora_path": str(lora_path),
+                "num_images": num_images
+            }
+        
+        metadata_path = self.output_dir / "all_metadata.json"
+        metadata_path.write_bytes(orjson.dumps(all_metadata, option=orjson.OPT_INDENT_2))
+        
         # Save batch results
         batch_results = {
             "created_at": datetime.datetime.now().isoformat(),
@@ -193,8 +218,7 @@ class EnhancedLoRACreator:
         }
         
         results_path = self.output_dir / "batch_training_results.json"
-        with open(results_path, "w") as f:
-            json.dump(batch_results, f, indent=2)
+        results_path.write_bytes(orjson.dumps(batch_results, option=orjson.OPT_INDENT_2))
         
         # Print summary
         logger.info("=" * 60)
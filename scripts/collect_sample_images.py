@@ -5,23 +5,101 @@ Creates sample training images from existing logos/sources
 """
 
 import os
+import asyncio
 import requests
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 import io
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-def create_sample_bitcoin_images():
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Reference logos (public domain/CC) downloaded next to the generated samples, per dataset
+SAMPLE_URLS = {
+    "bitcoin": [
+        "https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Bitcoin.svg/256px-Bitcoin.svg.png",
+        # Add more URLs as needed
+    ],
+    "ethereum": [],
+    "crypto_general": [],
+}
+
+_DOWNLOAD_HEADERS = {"User-Agent": "ai-cover-generator sample collector"}
+
+async def _fetch_all(urls) -> dict:
+    """Download all URLs concurrently; failed URLs are left out of the result"""
+    async with aiohttp.ClientSession(headers=_DOWNLOAD_HEADERS, timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async def fetch(url):
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return url, await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"   ⚠️  Download failed: {url} ({e})")
+                return url, None
+        
+        results = await asyncio.gather(*(fetch(url) for url in urls))
+    return {url: data for url, data in results if data is not None}
+
+def fetch_sample_logos(urls) -> dict:
+    """Fetch every sample URL in one batch; falls back to serial requests without aiohttp"""
+    if not urls:
+        return {}
+    if aiohttp is not None:
+        return asyncio.run(_fetch_all(urls))
+    
+    downloads = {}
+    for url in urls:
+        try:
+            response = requests.get(url, headers=_DOWNLOAD_HEADERS, timeout=30)
+            response.raise_for_status()
+            downloads[url] = response.content
+        except requests.RequestException as e:
+            print(f"   ⚠️  Download failed: {url} ({e})")
+    return downloads
+
+def save_downloaded_logos(target_dir: Path, name: str, downloads: dict):
+    """Decode already-downloaded reference logos for a dataset and save them as PNGs"""
+    for i, url in enumerate(SAMPLE_URLS.get(name, [])):
+        data = downloads.get(url)
+        if data is not None:
+            Image.open(io.BytesIO(data)).convert("RGBA").save(target_dir / f"{name}_download_{i+1}.png")
+
+@lru_cache(maxsize=16)
+def _load_font(path, size):
+    """Parse a font once per (path, size), falling back to Pillow's default"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+def _render(job):
+    """Run one (render_function, args) job; top-level so worker processes can unpickle it"""
+    render, args = job
+    render(*args)
+
+def _run_jobs(jobs, executor=None):
+    """Render jobs across the executor's processes, or inline without one"""
+    if executor is None:
+        for job in jobs:
+            _render(job)
+    else:
+        list(executor.map(_render, jobs))
+
+def create_sample_bitcoin_images(downloads: dict = None, executor=None):
     """Create sample Bitcoin training images"""
     print("🪙 Creating sample Bitcoin images...")
     
     bitcoin_dir = Path("training_data/bitcoin")
     bitcoin_dir.mkdir(parents=True, exist_ok=True)
     
-    # Sample Bitcoin logo URLs (public domain/CC)
-    sample_urls = [
-        "https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Bitcoin.svg/256px-Bitcoin.svg.png",
-        # Add more URLs as needed
-    ]
+    # Sample Bitcoin logos fetched up front by main()
+    save_downloaded_logos(bitcoin_dir, "bitcoin", downloads or {})
     
     # Create variations programmatically
     colors = [
@@ -32,28 +110,34 @@ def create_sample_bitcoin_images():
     ]
     
     # Create simple Bitcoin-style images
-    for i, bg_color in enumerate(colors):
-        create_logo_variation(
+    jobs = [
+        (create_logo_variation, (
             bitcoin_dir / f"bitcoin_sample_{i+1}.png",
             "₿", bg_color, (247, 147, 26) if bg_color != (247, 147, 26) else (255, 255, 255)
-        )
+        ))
+        for i, bg_color in enumerate(colors)
+    ]
     
     # Create text versions
     text_variations = ["BITCOIN", "BTC", "₿"]
-    for i, text in enumerate(text_variations):
-        create_text_logo(
+    jobs += [
+        (create_text_logo, (
             bitcoin_dir / f"bitcoin_text_{i+1}.png",
             text, (247, 147, 26), (255, 255, 255)
-        )
+        ))
+        for i, text in enumerate(text_variations)
+    ]
+    _run_jobs(jobs, executor)
     
     print(f"   ✅ Created sample images in {bitcoin_dir}")
 
-def create_sample_ethereum_images():
+def create_sample_ethereum_images(downloads: dict = None, executor=None):
     """Create sample Ethereum training images"""
     print("💎 Creating sample Ethereum images...")
     
     ethereum_dir = Path("training_data/ethereum")
     ethereum_dir.mkdir(parents=True, exist_ok=True)
+    save_downloaded_logos(ethereum_dir, "ethereum", downloads or {})
     
     colors = [
         (255, 255, 255),  # White
@@ -63,19 +147,24 @@ def create_sample_ethereum_images():
     ]
     
     # Create diamond-like shapes for Ethereum
-    for i, bg_color in enumerate(colors):
-        create_ethereum_variation(
+    jobs = [
+        (create_ethereum_variation, (
             ethereum_dir / f"ethereum_sample_{i+1}.png",
             bg_color, (98, 126, 234) if bg_color != (98, 126, 234) else (255, 255, 255)
-        )
+        ))
+        for i, bg_color in enumerate(colors)
+    ]
     
     # Create text versions
     text_variations = ["ETHEREUM", "ETH", "Ξ"]
-    for i, text in enumerate(text_variations):
-        create_text_logo(
+    jobs += [
+        (create_text_logo, (
             ethereum_dir / f"ethereum_text_{i+1}.png",
             text, (98, 126, 234), (255, 255, 255)
-        )
+        ))
+        for i, text in enumerate(text_variations)
+    ]
+    _run_jobs(jobs, executor)
     
     print(f"   ✅ Created sample images in {ethereum_dir}")
 
@@ -85,11 +174,8 @@ def create_logo_variation(filepath: Path, symbol: str, bg_color: tuple, text_col
     image = Image.new('RGB', (size, size), bg_color)
     draw = ImageDraw.Draw(image)
     
-    try:
-        # Try to use a system font
-        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 200)
-    except:
-        font = ImageFont.load_default()
+    # Try to use a system font
+    font = _load_font("/System/Library/Fonts/Arial.ttf", 200)
     
     # Center the text
     bbox = draw.textbbox((0, 0), symbol, font=font)
@@ -139,10 +225,7 @@ def create_text_logo(filepath: Path, text: str, text_color: tuple, bg_color: tup
     image = Image.new('RGB', (size, size), bg_color)
     draw = ImageDraw.Draw(image)
     
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 80)
-    except:
-        font = ImageFont.load_default()
+    font = _load_font("/System/Library/Fonts/Helvetica.ttc", 80)
     
     # Center the text
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -156,23 +239,25 @@ def create_text_logo(filepath: Path, text: str, text_color: tuple, bg_color: tup
     
     image.save(filepath)
 
-def create_sample_generic_crypto():
+def create_sample_generic_crypto(downloads: dict = None, executor=None):
     """Create generic crypto symbols"""
     print("🪙 Creating generic crypto samples...")
     
     crypto_dir = Path("training_data/crypto_general")
     crypto_dir.mkdir(parents=True, exist_ok=True)
+    save_downloaded_logos(crypto_dir, "crypto_general", downloads or {})
     
     symbols = ["₿", "Ξ", "◊", "●", "▲"]
     colors = [(255, 255, 255), (0, 0, 0), (50, 150, 250), (250, 150, 50)]
     
-    for i, symbol in enumerate(symbols):
-        for j, bg_color in enumerate(colors):
-            text_color = (0, 0, 0) if bg_color == (255, 255, 255) else (255, 255, 255)
-            create_logo_variation(
-                crypto_dir / f"crypto_symbol_{i}_{j}.png",
-                symbol, bg_color, text_color
-            )
+    jobs = [
+        (create_logo_variation, (
+            crypto_dir / f"crypto_symbol_{i}_{j}.png",
+            symbol, bg_color, (0, 0, 0) if bg_color == (255, 255, 255) else (255, 255, 255)
+        ))
+        for (i, symbol), (j, bg_color) in itertools.product(enumerate(symbols), enumerate(colors))
+    ]
+    _run_jobs(jobs, executor)
     
     print(f"   ✅ Created sample images in {crypto_dir}")
 
@@ -184,10 +269,14 @@ def main():
     print("For production, replace with high-quality official logos.")
     print()
     
-    # Create sample datasets
-    create_sample_bitcoin_images()
-    create_sample_ethereum_images()
-    create_sample_generic_crypto()
+    # Download every dataset's reference logos in one concurrent batch
+    downloads = fetch_sample_logos([url for urls in SAMPLE_URLS.values() for url in urls])
+    
+    # Create sample datasets, spreading each one's renders across all cores
+    with ProcessPoolExecutor() as executor:
+        create_sample_bitcoin_images(downloads, executor)
+        create_sample_ethereum_images(downloads, executor)
+        create_sample_generic_crypto(downloads, executor)
     
     print("\n✅ Sample datasets created!")
     print("\n📋 Next steps:")
@@ -10,25 +10,30 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.services.ai_service import AIService
 
-async def main():
+async def main(client_ids):
     """Debug LoRA names"""
     print("🔍 Debugging LoRA names and loading...")
     
     ai_service = AIService()
-    await ai_service.initialize()
+    
+    # Client lookups don't need the pipeline, so resolve them while it loads
+    _, *lora_names = await asyncio.gather(
+        ai_service.initialize(),
+        *(ai_service._get_lora_for_client(client_id) for client_id in client_ids)
+    )
     
     print("\n📋 Available LoRA models:")
     for name, info in ai_service.lora_models.items():
         print(f"  - {name}: {info.get('type', 'unknown')} ({info['path']})")
     
-    print(f"\n🎯 Looking for client 'xdc_network':")
-    lora_name = await ai_service._get_lora_for_client("xdc_network")
-    print(f"  Mapped to: {lora_name}")
-    
-    if lora_name:
-        print(f"  Exists in models? {'YES' if lora_name in ai_service.lora_models else 'NO'}")
-        if lora_name in ai_service.lora_models:
-            print(f"  Model info: {ai_service.lora_models[lora_name]}")
+    for client_id, lora_name in zip(client_ids, lora_names):
+        print(f"\n🎯 Looking for client '{client_id}':")
+        print(f"  Mapped to: {lora_name}")
+        
+        if lora_name:
+            print(f"  Exists in models? {'YES' if lora_name in ai_service.lora_models else 'NO'}")
+            if lora_name in ai_service.lora_models:
+                print(f"  Model info: {ai_service.lora_models[lora_name]}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(sys.argv[1:] or ["xdc_network"]))
\ No newline at end of file
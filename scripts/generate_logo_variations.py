@@ -7,45 +7,105 @@ Automatically handles backgrounds, sizes, effects, and formats
 
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
+from PIL import Image, ImageFilter, ImageEnhance
 import random
 import numpy as np
 
+# Background palettes, kept at module scope so worker processes import them instead of unpickling them
+BACKGROUND_COLORS = [
+    (255, 255, 255),    # White
+    (0, 0, 0),          # Black
+    (50, 50, 50),       # Dark gray
+    (200, 200, 200),    # Light gray
+    (240, 240, 240),    # Off-white
+    (30, 30, 30),       # Near black
+    (100, 100, 100),    # Medium gray
+    (250, 250, 250),    # Very light gray
+]
+
+GRADIENT_COLORS = [
+    [(0, 0, 0), (100, 100, 100)],      # Black to gray
+    [(255, 255, 255), (200, 200, 200)], # White to light gray
+    [(50, 50, 50), (150, 150, 150)],   # Dark to medium gray
+    [(240, 240, 240), (255, 255, 255)], # Light gradient
+]
+
+CRYPTO_COLORS = [
+    (247, 147, 26),     # Bitcoin orange
+    (98, 126, 234),     # Ethereum blue
+    (242, 169, 0),      # Binance gold
+    (0, 82, 255),       # Coinbase blue
+    (26, 117, 255),     # Crypto blue
+    (255, 102, 0),      # Orange
+]
+
+BACKGROUND_TYPES = ['solid', 'gradient', 'noise', 'crypto']
+GRADIENT_DIRECTIONS = ['vertical', 'horizontal']
+LOGO_EFFECTS = ['blur', 'sharpen', 'brightness_up', 'brightness_down', 'contrast_up', 'contrast_down']
+LOGO_POSITIONS = ['center', 'center', 'center', 'top_left', 'top_right', 'bottom_left', 'bottom_right', 'random']
+
+def plan_variations(count: int, seed: int) -> list:
+    """Draw every variation's random parameters up front in a few vectorized calls"""
+    rng = np.random.default_rng(seed)
+    scales = rng.uniform(0.3, 0.8, count)  # Logo size relative to background
+    bg_types = rng.integers(0, len(BACKGROUND_TYPES), count)
+    palette_picks = rng.random(count)  # scaled to whichever palette the background type uses
+    directions = rng.integers(0, len(GRADIENT_DIRECTIONS), count)
+    effect_rolls = rng.random(count)
+    effects = rng.integers(0, len(LOGO_EFFECTS), count)
+    positions = rng.integers(0, len(LOGO_POSITIONS), count)
+    
+    return [
+        {
+            "scale": float(scales[i]),
+            "bg_type": BACKGROUND_TYPES[bg_types[i]],
+            "palette_pick": float(palette_picks[i]),
+            "direction": GRADIENT_DIRECTIONS[directions[i]],
+            "effect": LOGO_EFFECTS[effects[i]] if effect_rolls[i] < 0.3 else None,  # 30% chance of effect
+            # First few variations use center position
+            "position": 'center' if i < 5 else LOGO_POSITIONS[positions[i]],
+        }
+        for i in range(count)
+    ]
+
+# Per-process state for variation workers, set once by _init_worker
+_worker_generator = None
+_worker_logo = None
+_worker_save = None
+
+def _save_png(image, path):
+    # Training images are re-read once; fast zlib beats smaller files here
+    image.save(path, compress_level=1)
+
+def _init_worker(output_size, logo, save=None):
+    global _worker_generator, _worker_logo, _worker_save
+    _worker_generator = LogoVariationGenerator(output_size=output_size)
+    _worker_logo = logo
+    _worker_save = save
+
+def _make_one_variation(i, plan, output_path, seed):
+    """Build and save variation i; noise and free placement are seeded per index so results
+    don't depend on worker scheduling"""
+    random.seed(seed + i)
+    np.random.seed((seed + i) % 2**32)
+    return _worker_generator.make_variation(_worker_logo, i, Path(output_path), plan, save=_worker_save)
+
 class LogoVariationGenerator:
     def __init__(self, output_size=(512, 512)):
         self.output_size = output_size
         self.variation_count = 0
         
-        # Background colors for variations
-        self.background_colors = [
-            (255, 255, 255),    # White
-            (0, 0, 0),          # Black
-            (50, 50, 50),       # Dark gray
-            (200, 200, 200),    # Light gray
-            (240, 240, 240),    # Off-white
-            (30, 30, 30),       # Near black
-            (100, 100, 100),    # Medium gray
-            (250, 250, 250),    # Very light gray
-        ]
-        
-        # Gradient backgrounds
-        self.gradient_colors = [
-            [(0, 0, 0), (100, 100, 100)],      # Black to gray
-            [(255, 255, 255), (200, 200, 200)], # White to light gray
-            [(50, 50, 50), (150, 150, 150)],   # Dark to medium gray
-            [(240, 240, 240), (255, 255, 255)], # Light gradient
-        ]
-        
-        # Crypto-themed backgrounds
-        self.crypto_colors = [
-            (247, 147, 26),     # Bitcoin orange
-            (98, 126, 234),     # Ethereum blue
-            (242, 169, 0),      # Binance gold
-            (0, 82, 255),       # Coinbase blue
-            (26, 117, 255),     # Crypto blue
-            (255, 102, 0),      # Orange
-        ]
+        self.background_colors = BACKGROUND_COLORS
+        self.gradient_colors = GRADIENT_COLORS
+        self.crypto_colors = CRYPTO_COLORS
+        
+        # Reused uint8 canvas for array-built backgrounds. Image.fromarray copies RGB
+        # data, so images handed off for saving never alias it
+        width, height = output_size
+        self._rgb_scratch = np.empty((height, width, 3), dtype=np.uint8)
     
     def load_logo(self, logo_path: str) -> Image.Image:
         """Load and prepare logo image"""
@@ -90,37 +150,28 @@ class LogoVariationGenerator:
     def create_gradient_background(self, color1: tuple, color2: tuple, direction='vertical') -> Image.Image:
         """Create gradient background"""
         width, height = self.output_size
-        background = Image.new('RGB', self.output_size, color1)
-        draw = ImageDraw.Draw(background)
         
+        # One colour ramp along the gradient axis; Pillow stretches it across the other
+        # axis, so no full-size NumPy array is ever materialized
         if direction == 'vertical':
-            for y in range(height):
-                ratio = y / height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                draw.line([(0, y), (width, y)], fill=(r, g, b))
+            ratio = (np.arange(height, dtype=np.float64) / height)[:, None, None]
         else:  # horizontal
-            for x in range(width):
-                ratio = x / width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                draw.line([(x, 0), (x, height)], fill=(r, g, b))
+            ratio = (np.arange(width, dtype=np.float64) / width)[None, :, None]
+        ramp = (np.array(color1, dtype=np.float64) * (1 - ratio) + np.array(color2, dtype=np.float64) * ratio).astype(np.uint8)
         
-        return background
+        return Image.fromarray(ramp, 'RGB').resize(self.output_size, Image.Resampling.NEAREST)
     
     def create_noise_background(self, base_color: tuple, noise_level=20) -> Image.Image:
         """Create background with subtle noise"""
         width, height = self.output_size
-        background = Image.new('RGB', self.output_size, base_color)
         
-        # Add noise
-        noise = np.random.randint(-noise_level, noise_level, (height, width, 3))
-        bg_array = np.array(background)
-        noisy_array = np.clip(bg_array + noise, 0, 255).astype(np.uint8)
+        # Add noise in place on an int16 canvas (headroom for the clip, a quarter of int64's traffic)
+        noisy_array = np.random.randint(-noise_level, noise_level, (height, width, 3), dtype=np.int16)
+        np.add(noisy_array, np.array(base_color, dtype=np.int16), out=noisy_array)
+        np.clip(noisy_array, 0, 255, out=noisy_array)
+        np.copyto(self._rgb_scratch, noisy_array, casting='unsafe')
         
-        return Image.fromarray(noisy_array)
+        return Image.fromarray(self._rgb_scratch, 'RGB')
     
     def apply_logo_effects(self, logo: Image.Image, effect_type: str) -> Image.Image:
         """Apply effects to logo"""
@@ -171,8 +222,44 @@ class LogoVariationGenerator:
         background.paste(logo, (x, y), logo)
         return background
     
-    def generate_variations(self, logo_path: str, output_dir: str, count: int = 25) -> list:
-        """Generate multiple logo variations"""
+    def make_variation(self, original_logo: Image.Image, i: int, output_path: Path, plan: dict, save=None) -> str:
+        """Build variation i from its plan_variations() entry and save it (via `save` if given); returns the file path"""
+        variation_name = f"variation_{i+1:02d}.png"
+        variation_path = output_path / variation_name
+        
+        # Resize logo
+        sized_logo = self.resize_logo_for_background(original_logo, self.output_size, plan["scale"])
+        
+        # Build the planned background type
+        bg_type = plan["bg_type"]
+        palette = {
+            'solid': self.background_colors,
+            'gradient': self.gradient_colors,
+            'noise': self.background_colors,
+            'crypto': self.crypto_colors,
+        }[bg_type]
+        color = palette[int(plan["palette_pick"] * len(palette))]
+        
+        if bg_type == 'gradient':
+            background = self.create_gradient_background(color[0], color[1], plan["direction"])
+        elif bg_type == 'noise':
+            background = self.create_noise_background(color)
+        else:  # solid / crypto
+            background = self.create_solid_background(color)
+        
+        # Apply planned effect to logo
+        if plan["effect"]:
+            sized_logo = self.apply_logo_effects(sized_logo, plan["effect"])
+        
+        # Create final variation
+        final_image = self.position_logo_on_background(background, sized_logo, plan["position"])
+        
+        # Save variation
+        (save or _save_png)(final_image, variation_path)
+        return str(variation_path)
+    
+    def generate_variations(self, logo_path: str, output_dir: str, count: int = 25, workers: int = None, seed: int = None) -> list:
+        """Generate multiple logo variations, one worker process per CPU core by default"""
         
         print(f"🎨 Generating {count} logo variations...")
         
@@ -183,57 +270,37 @@ class LogoVariationGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
+        if seed is None:
+            seed = random.randrange(2**32)
+        workers = min(workers or os.cpu_count() or 1, count)
+        make_variation = partial(_make_one_variation, output_path=str(output_path), seed=seed)
+        plans = plan_variations(count, seed)
+        
         variations = []
+        pending_saves = []
         
-        # Generate variations
-        for i in range(count):
-            variation_name = f"variation_{i+1:02d}.png"
-            variation_path = output_path / variation_name
-            
-            # Choose variation parameters
-            scale_factor = random.uniform(0.3, 0.8)  # Logo size relative to background
-            
-            # Resize logo
-            sized_logo = self.resize_logo_for_background(original_logo, self.output_size, scale_factor)
-            
-            # Choose background type
-            bg_type = random.choice(['solid', 'gradient', 'noise', 'crypto'])
-            
-            if bg_type == 'solid':
-                bg_color = random.choice(self.background_colors)
-                background = self.create_solid_background(bg_color)
-            elif bg_type == 'gradient':
-                colors = random.choice(self.gradient_colors)
-                direction = random.choice(['vertical', 'horizontal'])
-                background = self.create_gradient_background(colors[0], colors[1], direction)
-            elif bg_type == 'noise':
-                base_color = random.choice(self.background_colors)
-                background = self.create_noise_background(base_color)
-            else:  # crypto
-                crypto_color = random.choice(self.crypto_colors)
-                background = self.create_solid_background(crypto_color)
-            
-            # Apply random effect to logo
-            if random.random() < 0.3:  # 30% chance of effect
-                effect = random.choice(['blur', 'sharpen', 'brightness_up', 'brightness_down', 'contrast_up', 'contrast_down'])
-                sized_logo = self.apply_logo_effects(sized_logo, effect)
-            
-            # Position logo
-            if i < 5:
-                # First few variations use center position
-                position = 'center'
-            else:
-                position = random.choice(['center', 'center', 'center', 'top_left', 'top_right', 'bottom_left', 'bottom_right', 'random'])
-            
-            # Create final variation
-            final_image = self.position_logo_on_background(background, sized_logo, position)
-            
-            # Save variation
-            final_image.save(variation_path)
-            variations.append(str(variation_path))
-            
-            if (i + 1) % 5 == 0:
-                print(f"   ✅ Generated {i + 1}/{count} variations")
+        # The logo is shipped to each worker once via the initializer, not with every task
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(self.output_size, original_logo))
+            results = executor.map(make_variation, range(count), plans, chunksize=max(1, count // (workers * 4)))
+        else:
+            # Single process: PNG encodes overlap with composing the next variation
+            executor = ThreadPoolExecutor(max_workers=4)
+            _init_worker(self.output_size, original_logo,
+                         save=lambda image, path: pending_saves.append(executor.submit(_save_png, image, path)))
+            results = map(make_variation, range(count), plans)
+        
+        try:
+            for i, variation_path in enumerate(results):
+                variations.append(variation_path)
+                
+                if (i + 1) % 5 == 0:
+                    print(f"   ✅ Generated {i + 1}/{count} variations")
+            for future in pending_saves:
+                future.result()
+        finally:
+            executor.shutdown()
         
         print(f"✅ All variations saved to: {output_path}")
         return variations
@@ -244,6 +311,7 @@ def main():
     parser.add_argument("--output-dir", "-o", required=True, help="Output directory")
     parser.add_argument("--count", "-c", type=int, default=25, help="Number of variations to generate")
     parser.add_argument("--size", "-s", default="512x512", help="Output size (e.g., 512x512)")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes (default: CPU count)")
     
     args = parser.parse_args()
     
@@ -267,7 +335,8 @@ def main():
         variations = generator.generate_variations(
             logo_path=args.input,
             output_dir=args.output_dir,
-            count=args.count
+            count=args.count,
+            workers=args.workers
         )
         
         print(f"\n🎉 Success! Generated {len(variations)} logo variations")
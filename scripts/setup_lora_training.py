@@ -7,8 +7,75 @@ Uses a simplified but effective training approach
 import os
 import sys
 import subprocess
+from importlib import metadata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Wheel/HTTP cache shared by every pip run here (and by CI, which can cache this path)
+PIP_CACHE_DIR = Path(os.environ.get("PIP_CACHE_DIR", ".pip-cache")).resolve()
+
+def _pip_install_cmd(*args):
+    return [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check',
+            '--cache-dir', str(PIP_CACHE_DIR), '--prefer-binary', *args]
+
+def _run_pip(*args, interactive=None):
+    """Run pip install; on a terminal pip draws its own progress, otherwise stdout is
+    discarded and only stderr is kept, for the failure report"""
+    if interactive is None:
+        interactive = sys.stdout.isatty()
+    if interactive:
+        return subprocess.run(_pip_install_cmd(*args))
+    return subprocess.run(_pip_install_cmd(*args), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+def _print_pip_error(result, lines=10):
+    """Show the tail of a failed non-interactive pip run's stderr"""
+    if result.stderr:
+        for line in result.stderr.decode(errors="replace").splitlines()[-lines:]:
+            print(f"      {line}")
+
+def is_installed(package):
+    """True if a distribution named `package` is installed (no import, no pip startup)"""
+    try:
+        metadata.distribution(package)
+        return True
+    except metadata.PackageNotFoundError:
+        return False
+
+def pip_install(packages):
+    """Install packages in one pip run; on failure retry them individually, in parallel,
+    so a single unavailable package (e.g. bitsandbytes on Mac) doesn't sink the rest.
+    Returns (installed, failed)."""
+    # Already-installed distributions skip pip entirely
+    already = [p for p in packages if is_installed(p)]
+    packages = [p for p in packages if p not in already]
+    if not packages:
+        return already, []
+    
+    result = _run_pip(*packages)
+    if result.returncode == 0:
+        return already + list(packages), []
+    
+    # The retries are network-bound, so they run concurrently. They share the pip cache
+    # (its writes are atomic) and honour the user's pip.conf / PIP_* settings, e.g. a private index.
+    # The failed batch has usually installed shared dependencies already
+    # Concurrent progress bars would interleave, so the retries never draw to the terminal
+    def install_one(package):
+        result = _run_pip(package, interactive=False)
+        if result.returncode != 0:
+            print(f"   ⚠️  pip install {package} failed:")
+            _print_pip_error(result)
+        return result.returncode == 0
+    
+    succeeded = set()
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(packages))) as executor:
+        futures = {executor.submit(install_one, package): package for package in packages}
+        for future in as_completed(futures):
+            if future.result():
+                succeeded.add(futures[future])
+    
+    return (already + [p for p in packages if p in succeeded],
+            [p for p in packages if p not in succeeded])
+
 def check_dependencies():
     """Check if required packages are installed"""
     print("🔍 Checking dependencies...")
@@ -23,12 +90,12 @@ def check_dependencies():
         'pillow'
     ]
     
+    # Distribution metadata lookups only; importing torch & co. just to probe them costs seconds
     missing = []
     for package in required_packages:
-        try:
-            __import__(package)
+        if is_installed(package):
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             missing.append(package)
             print(f"   ❌ {package}")
     
@@ -46,14 +113,12 @@ def install_training_dependencies():
         'bitsandbytes',  # For 8-bit training (if available on Mac)
     ]
     
-    for package in training_packages:
-        try:
-            print(f"   Installing {package}...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', package], 
-                         check=True, capture_output=True)
-            print(f"   ✅ {package} installed")
-        except subprocess.CalledProcessError as e:
-            print(f"   ⚠️  {package} failed to install: {e}")
+    print(f"   Installing {', '.join(training_packages)}...")
+    installed, failed = pip_install(training_packages)
+    for package in installed:
+        print(f"   ✅ {package} installed")
+    for package in failed:
+        print(f"   ⚠️  {package} failed to install")
 
 def setup_kohya_trainer():
     """Setup Kohya LoRA trainer (recommended for production)"""
@@ -64,8 +129,9 @@ def setup_kohya_trainer():
     if not kohya_dir.exists():
         print("📥 Cloning Kohya LoRA trainer...")
         try:
+            # Only the working tree is used; run `git fetch --unshallow` there if history is ever needed
             subprocess.run([
-                'git', 'clone', 
+                'git', 'clone', '--depth', '1', '--single-branch', '--no-tags',
                 'https://github.com/kohya-ss/sd-scripts.git',
                 str(kohya_dir)
             ], check=True)
@@ -80,14 +146,12 @@ def setup_kohya_trainer():
     requirements_file = kohya_dir / "requirements.txt"
     if requirements_file.exists():
         print("📦 Installing Kohya requirements...")
-        try:
-            subprocess.run([
-                sys.executable, '-m', 'pip', 'install', 
-                '-r', str(requirements_file)
-            ], check=True, capture_output=True)
+        result = _run_pip('-r', str(requirements_file))
+        if result.returncode == 0:
             print("   ✅ Kohya requirements installed")
-        except subprocess.CalledProcessError:
+        else:
             print("   ⚠️  Some Kohya requirements may have failed")
+            _print_pip_error(result)
     
     return True
 
@@ -151,19 +215,18 @@ def main():
     """Main setup function"""
     print("🚀 LoRA Training Setup for Mac Studio")
     print("=" * 50)
+    print(f"📦 pip cache: {PIP_CACHE_DIR}")
     
     # Check current dependencies
     missing = check_dependencies()
     if missing:
         print(f"\n❌ Missing packages: {', '.join(missing)}")
         print("📦 Installing missing packages...")
-        for package in missing:
-            try:
-                subprocess.run([sys.executable, '-m', 'pip', 'install', package], 
-                             check=True, capture_output=True)
-                print(f"   ✅ {package} installed")
-            except subprocess.CalledProcessError:
-                print(f"   ❌ Failed to install {package}")
+        installed, failed = pip_install(missing)
+        for package in installed:
+            print(f"   ✅ {package} installed")
+        for package in failed:
+            print(f"   ❌ Failed to install {package}")
     
     # Install training-specific dependencies
     install_training_dependencies()
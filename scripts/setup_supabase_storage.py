@@ -16,13 +16,16 @@ def create_storage_sql():
         """,
         
         # Create policy to allow public read access to cover images
+        # (CREATE POLICY has no IF NOT EXISTS; dropping first keeps re-runs inside the transaction)
         """
+        DROP POLICY IF EXISTS "Public read access for cover images" ON storage.objects;
         CREATE POLICY "Public read access for cover images" ON storage.objects
         FOR SELECT USING (bucket_id = 'cover-images');
         """,
         
         # Create policy to allow authenticated users to upload cover images
         """
+        DROP POLICY IF EXISTS "Authenticated users can upload cover images" ON storage.objects;
         CREATE POLICY "Authenticated users can upload cover images" ON storage.objects
         FOR INSERT WITH CHECK (bucket_id = 'cover-images' AND auth.role() = 'authenticated');
         """,
@@ -53,32 +56,43 @@ def create_storage_sql():
         );
         """,
         
-        # Insert your client mappings
+        # Look up generated images by client without a sequential scan
         """
-        INSERT INTO client_logos (client_id, logo_name, description) VALUES
-        ('xdc', 'xdc_network', 'XDC Network - Enterprise blockchain'),
-        ('xdc_network', 'xdc_network', 'XDC Network - Main logo'),
-        ('xdc_logo', 'xdc_logo', 'XDC Network - Alternative logo'),
-        ('hedera', 'hedera', 'Hedera Hashgraph - Main network'),
-        ('hedera_foundation', 'hedera_foundation', 'Hedera Foundation'),
-        ('hbar', 'hbar', 'HBAR - Hedera native token'),
-        ('hashpack', 'hashpack', 'HashPack - Hedera wallet'),
-        ('hashpack_color', 'hashpack_color', 'HashPack - Color version'),
-        ('constellation', 'constellation', 'Constellation - DAG network'),
-        ('dag', 'constellation', 'Constellation - DAG network'),
-        ('constellation_alt', 'constellation_alt', 'Constellation - Alternative'),
-        ('algorand', 'algorand', 'Algorand - Blockchain platform'),
-        ('algo', 'algorand', 'Algorand - Short name'),
-        ('tha', 'tha', 'THA - Blockchain services'),
-        ('tha_color', 'tha_color', 'THA - Color version'),
-        ('genfinity', 'genfinity', 'Genfinity - Crypto media'),
-        ('gen', 'genfinity', 'Genfinity - Short name'),
-        ('genfinity_black', 'genfinity_black', 'Genfinity - Black version')
+        CREATE INDEX IF NOT EXISTS generated_images_client_id_idx ON generated_images (client_id);
+        """,
+        
+        # Insert your client mappings (anti-join so re-runs only write new clients)
+        """
+        INSERT INTO client_logos (client_id, logo_name, description)
+        SELECT v.client_id, v.logo_name, v.description
+        FROM (VALUES
+            ('xdc', 'xdc_network', 'XDC Network - Enterprise blockchain'),
+            ('xdc_network', 'xdc_network', 'XDC Network - Main logo'),
+            ('xdc_logo', 'xdc_logo', 'XDC Network - Alternative logo'),
+            ('hedera', 'hedera', 'Hedera Hashgraph - Main network'),
+            ('hedera_foundation', 'hedera_foundation', 'Hedera Foundation'),
+            ('hbar', 'hbar', 'HBAR - Hedera native token'),
+            ('hashpack', 'hashpack', 'HashPack - Hedera wallet'),
+            ('hashpack_color', 'hashpack_color', 'HashPack - Color version'),
+            ('constellation', 'constellation', 'Constellation - DAG network'),
+            ('dag', 'constellation', 'Constellation - DAG network'),
+            ('constellation_alt', 'constellation_alt', 'Constellation - Alternative'),
+            ('algorand', 'algorand', 'Algorand - Blockchain platform'),
+            ('algo', 'algorand', 'Algorand - Short name'),
+            ('tha', 'tha', 'THA - Blockchain services'),
+            ('tha_color', 'tha_color', 'THA - Color version'),
+            ('genfinity', 'genfinity', 'Genfinity - Crypto media'),
+            ('gen', 'genfinity', 'Genfinity - Short name'),
+            ('genfinity_black', 'genfinity_black', 'Genfinity - Black version')
+        ) AS v (client_id, logo_name, description)
+        LEFT JOIN client_logos c USING (client_id)
+        WHERE c.client_id IS NULL
         ON CONFLICT (client_id) DO NOTHING;
         """
     ]
     
-    return sql_commands
+    # One transaction: a single round trip, and a failing statement rolls back the rest
+    return ["BEGIN;"] + sql_commands + ["COMMIT;"]
 
 def main():
     """Setup Supabase storage and database"""
@@ -92,31 +106,27 @@ def main():
     print("📝 SQL Commands to execute in Supabase:")
     print("1. Go to your Supabase dashboard")
     print("2. Navigate to SQL Editor")
-    print("3. Run these commands:")
+    print("3. Run this script in one go:")
     print()
     
-    for i, sql in enumerate(sql_commands, 1):
-        print(f"-- Command {i}:")
-        print(sql.strip())
-        print()
+    script = "\n\n".join(sql.strip() for sql in sql_commands)
+    print(script)
+    print()
     
     # Save to file
     with open("supabase_setup.sql", "w") as f:
-        f.write("-- Supabase Setup for AI Cover Generator\\n")
-        f.write("-- Run these commands in your Supabase SQL Editor\\n\\n")
-        
-        for i, sql in enumerate(sql_commands, 1):
-            f.write(f"-- Command {i}:\\n")
-            f.write(sql.strip() + "\\n\\n")
+        f.write("-- Supabase Setup for AI Cover Generator\n")
+        f.write("-- Paste this whole file into your Supabase SQL Editor and run it once\n\n")
+        f.write(script + "\n")
     
-    print("💾 SQL commands saved to: supabase_setup.sql")
+    print("💾 SQL script saved to: supabase_setup.sql")
     print()
     print("🚀 Next steps:")
-    print("1. Copy the SQL commands above")
+    print("1. Copy the SQL script above")
     print("2. Go to https://supabase.com/dashboard/projects")
     print("3. Select your 'crypto-news-curator' project")
     print("4. Go to SQL Editor")
-    print("5. Paste and run each command")
+    print("5. Paste it and run it once")
     print("6. Come back here when done!")
     
     return 0
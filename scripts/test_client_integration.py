@@ -4,12 +4,29 @@ Test Client Logo Integration
 Simulates how client logos will work in the main API
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+
+@lru_cache(maxsize=None)
+def count_training_images(lora_name: str):
+    """Training images for a LoRA in one directory pass, or None without a data folder;
+    cached because several client ids map to the same folder"""
+    try:
+        with os.scandir(f"training_data/{lora_name}") as entries:
+            return sum(
+                1 for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS and entry.is_file()
+            )
+    except FileNotFoundError:
+        return None
+
 def test_client_logo_mapping():
     """Test client ID to logo mapping"""
     print("🔍 Testing Client Logo Mapping...")
@@ -34,9 +51,8 @@ def test_client_logo_mapping():
             print(f"   ✅ {client_id} → {lora_name}")
             
             # Check if training data exists
-            training_path = Path(f"training_data/{lora_name}")
-            if training_path.exists():
-                image_count = len(list(training_path.glob("*.png")))
+            image_count = count_training_images(lora_name)
+            if image_count is not None:
                 print(f"      📁 Training data: {image_count} images")
             else:
                 print(f"      ⚠️  No training data found")
@@ -7,6 +7,7 @@ Verifies that all client LoRAs are properly loaded and work
 import sys
 import asyncio
 from pathlib import Path
+from typing import Optional
 import logging
 
 # Add parent directory to path for imports
@@ -14,16 +15,41 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.services.ai_service import AIService
 
-logging.basicConfig(level=logging.INFO)
+class _TaskNameFilter(logging.Filter):
+    """Tag records with the asyncio task that emitted them; tests run concurrently"""
+    def filter(self, record):
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        record.task_name = task.get_name() if task else "main"
+        return True
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:[%(task_name)s] %(message)s")
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(_TaskNameFilter())
 logger = logging.getLogger(__name__)
 
+# One initialized service shared by every test; SDXL and the LoRAs load once per run
+_service: Optional[AIService] = None
+_service_lock = asyncio.Lock()
+
+async def get_service() -> AIService:
+    """Return the shared AIService, building and initializing it on first use"""
+    global _service
+    async with _service_lock:
+        if _service is None:
+            service = AIService()
+            await service.initialize()
+            _service = service
+    return _service
+
 async def test_lora_loading():
     """Test LoRA loading functionality"""
     logger.info("🔄 Testing LoRA loading...")
     
     # Initialize AI service
-    ai_service = AIService()
-    await ai_service.initialize()
+    ai_service = await get_service()
     
     # Check status
     status = await ai_service.get_status()
@@ -38,8 +64,7 @@ async def test_client_lora_mapping():
     """Test client LoRA mapping"""
     logger.info("🎯 Testing client LoRA mapping...")
     
-    ai_service = AIService()
-    await ai_service.initialize()
+    ai_service = await get_service()
     
     # Test some key client mappings
     test_clients = [
@@ -52,8 +77,11 @@ async def test_client_lora_mapping():
         "tha"
     ]
     
-    for client_id in test_clients:
-        lora_name = await ai_service._get_lora_for_client(client_id)
+    # Resolve every client in one batch, then report from the resolved table
+    lora_names = await asyncio.gather(
+        *(ai_service._get_lora_for_client(client_id) for client_id in test_clients)
+    )
+    for client_id, lora_name in zip(test_clients, lora_names):
         logger.info(f"  {client_id} → {lora_name}")
     
     return True
@@ -62,8 +90,7 @@ async def test_background_generation():
     """Test background generation with client LoRA"""
     logger.info("🎨 Testing background generation...")
     
-    ai_service = AIService()
-    await ai_service.initialize()
+    ai_service = await get_service()
     
     try:
         # Test generation with XDC client
@@ -91,15 +118,19 @@ async def main():
     logger.info("=" * 60)
     
     try:
-        # Test 1: LoRA Loading
-        ai_service = await test_lora_loading()
-        logger.info("✅ LoRA loading test passed")
+        # Pay the model load once, up front, rather than inside the first test
+        logger.info("⏳ Initializing AI service...")
+        await get_service()
         
-        # Test 2: Client Mapping
-        await test_client_lora_mapping()
+        # Tests 1 & 2 only read the shared service, so they run concurrently
+        ai_service, _ = await asyncio.gather(
+            asyncio.create_task(test_lora_loading(), name="lora_loading"),
+            asyncio.create_task(test_client_lora_mapping(), name="client_mapping"),
+        )
+        logger.info("✅ LoRA loading test passed")
         logger.info("✅ Client mapping test passed")
         
-        # Test 3: Background Generation
+        # Test 3: Background Generation (holds the GPU/MPS device, so it runs alone)
         success = await test_background_generation()
         if success:
             logger.info("✅ Background generation test passed")
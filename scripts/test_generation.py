@@ -7,6 +7,8 @@ Tests the complete pipeline locally
 import sys
 import asyncio
 from pathlib import Path
+from typing import Optional
+import torch
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -14,12 +16,25 @@ sys.path.append(str(Path(__file__).parent.parent))
 from app.services.ai_service import AIService
 from app.models.requests import GenerateCoverRequest, ImageSize
 
+# One initialized service shared by every test; SDXL and the LoRAs load once per run
+_service: Optional[AIService] = None
+_service_lock = asyncio.Lock()
+
+async def get_service() -> AIService:
+    """Return the shared AIService, building and initializing it on first use"""
+    global _service
+    async with _service_lock:
+        if _service is None:
+            service = AIService()
+            await service.initialize()
+            _service = service
+    return _service
+
 async def test_basic_generation():
     """Test basic image generation without LoRA"""
     print("🧪 Testing basic image generation...")
     
-    ai_service = AIService()
-    await ai_service.initialize()
+    ai_service = await get_service()
     
     # Test prompt
     test_prompt = "Bitcoin reaches new all-time high"
@@ -55,8 +70,7 @@ async def test_api_request():
         size=ImageSize.STANDARD
     )
     
-    ai_service = AIService()
-    await ai_service.initialize()
+    ai_service = await get_service()
     
     # Generate with client_id (will attempt to load LoRA)
     image = await ai_service.generate_background(
@@ -83,54 +97,54 @@ async def test_different_sizes():
     """Test different image sizes"""
     print("🧪 Testing different image sizes...")
     
-    ai_service = AIService()
-    await ai_service.initialize()
+    ai_service = await get_service()
     
     sizes = [
         (ImageSize.STANDARD, "1800x900"),
         (ImageSize.HD, "1920x1080")
     ]
     
-    for size_enum, size_str in sizes:
-        request = GenerateCoverRequest(
-            title=f"Test Image {size_str}",
-            subtitle="Size compatibility test",
-            size=size_enum
-        )
-        
-        # Generate image
+    output_path = Path("./temp_images")
+    output_path.mkdir(exist_ok=True)
+    
+    # generate_background always renders at settings.IMAGE_WIDTH x IMAGE_HEIGHT and the
+    # size suffix in the title doesn't change the prompt, so one background serves every size
+    with torch.inference_mode():
         image = await ai_service.generate_background(
-            prompt_enhancement=request.title
+            prompt_enhancement="Test Image"
         )
         
-        # Add text overlay
-        final_image = await ai_service.add_text_overlay(
-            image=image,
-            title=request.title,
-            subtitle=request.subtitle,
-            size=(request.width, request.height)
-        )
-        
-        # Save test image
-        output_path = Path("./temp_images")
-        output_path.mkdir(exist_ok=True)
-        
-        filename = f"test_size_{size_str.replace('x', '_')}.png"
-        final_image.save(output_path / filename)
-        print(f"✅ {size_str} test image saved to: {output_path / filename}")
+        for size_enum, size_str in sizes:
+            request = GenerateCoverRequest(
+                title=f"Test Image {size_str}",
+                subtitle="Size compatibility test",
+                size=size_enum
+            )
+            
+            # Add text overlay
+            final_image = await ai_service.add_text_overlay(
+                image=image,
+                title=request.title,
+                subtitle=request.subtitle,
+                size=(request.width, request.height)
+            )
+            
+            # Save test image
+            filename = f"test_size_{size_str.replace('x', '_')}.png"
+            final_image.save(output_path / filename)
+            print(f"✅ {size_str} test image saved to: {output_path / filename}")
 
 async def test_system_info():
     """Test system capabilities"""
     print("🔍 Testing system information...")
     
-    ai_service = AIService()
+    ai_service = await get_service()
     
     # Check device
     print(f"🖥️  Device: {ai_service.device}")
     print(f"🧠 MPS Available: {ai_service.device == 'mps'}")
     
-    # Initialize and check status
-    await ai_service.initialize()
+    # Check status
     status = await ai_service.get_status()
     
     print("📊 System Status:")
@@ -144,6 +158,11 @@ def main():
     
     async def run_tests():
         try:
+            # Pay the model load once, up front, rather than inside the first test
+            print("⏳ Initializing AI service...")
+            await get_service()
+            print()
+            
             await test_system_info()
             print()
             
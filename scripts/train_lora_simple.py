@@ -200,6 +200,30 @@ class SimpleLoRATrainer:
         
         return str(lora_file)
 
+def train(logo_name: str,
+          epochs: int = 100,
+          learning_rate: float = 1e-4,
+          rank: int = 64,
+          data_dir: str = "./training_data",
+          output_dir: str = "./models/lora",
+          trainer: SimpleLoRATrainer = None) -> str:
+    """Train one logo LoRA; pass a loaded trainer to reuse its base SDXL weights across logos"""
+    if trainer is None:
+        trainer = SimpleLoRATrainer()
+    if trainer.pipeline is None:
+        trainer.load_model()
+    
+    # Fresh LoRA processors are attached per call, so only the adapter changes between logos
+    training_data = trainer.prepare_training_data(data_dir, logo_name)
+    
+    return trainer.train_logo_lora(
+        training_data=training_data,
+        output_dir=output_dir,
+        epochs=epochs,
+        learning_rate=learning_rate,
+        rank=rank
+    )
+
 def main():
     parser = argparse.ArgumentParser(description="Simple LoRA training for crypto logos")
     parser.add_argument("--data-dir", default="./training_data", help="Training data directory")
@@ -228,20 +252,13 @@ def main():
     print(f"✅ Found {len(image_files)} training images for {args.logo_name}")
     
     try:
-        # Initialize trainer
-        trainer = SimpleLoRATrainer()
-        trainer.load_model()
-        
-        # Prepare training data
-        training_data = trainer.prepare_training_data(args.data_dir, args.logo_name)
-        
-        # Train LoRA
-        output_file = trainer.train_logo_lora(
-            training_data=training_data,
-            output_dir=args.output_dir,
+        output_file = train(
+            args.logo_name,
             epochs=args.epochs,
             learning_rate=args.learning_rate,
-            rank=args.rank
+            rank=args.rank,
+            data_dir=args.data_dir,
+            output_dir=args.output_dir
         )
         
         print(f"\n🎉 Training complete!")
@@ -111,14 +111,17 @@ class SimpleCoverGenerator:
         
         return lines
     
-    def generate_cover(self, title, subtitle=None, client="generic", article_file=None):
+    def generate_cover(self, title, subtitle=None, client="generic", article_file=None, output=None):
         """Generate a simple cover image"""
         
         print(f"🎨 Generating simple cover for {client}: {title}")
         
         # Read article content if provided
         article_content = ""
-        if article_file and os.path.exists(article_file):
+        if article_file == "-":
+            article_content = sys.stdin.read()
+            print(f"📖 Read article content from stdin ({len(article_content)} chars)")
+        elif article_file and os.path.exists(article_file):
             with open(article_file, 'r', encoding='utf-8') as f:
                 article_content = f.read()
             print(f"📖 Read article content ({len(article_content)} chars)")
@@ -190,8 +193,8 @@ class SimpleCoverGenerator:
             ai_text = "🤖 AI Enhanced"
             draw.text((50, height - 80), ai_text, font=meta_font, fill=colors["text"])
         
-        # Save the image
-        output_file = self.output_dir / f"boxed_cover_{client}.png"
+        # Save the image (output may be a path or a binary file object)
+        output_file = output or self.output_dir / f"boxed_cover_{client}.png"
         img.save(output_file, "PNG", quality=95)
         
         print(f"✅ Cover saved: {output_file}")
@@ -202,16 +205,24 @@ def main():
     parser.add_argument("--title", required=True, help="Article title")
     parser.add_argument("--subtitle", help="Article subtitle")
     parser.add_argument("--client", default="generic", help="Client ID")
-    parser.add_argument("--article", help="Article file path")
+    parser.add_argument("--article", help="Article file path ('-' reads from stdin)")
+    parser.add_argument("--output", help="Output PNG path ('-' writes to stdout)")
     
     args = parser.parse_args()
     
+    output = args.output
+    if output == "-":
+        # Keep stdout clean for the PNG stream; progress goes to stderr
+        output = sys.stdout.buffer
+        sys.stdout = sys.stderr
+    
     generator = SimpleCoverGenerator()
     output_path = generator.generate_cover(
         title=args.title,
         subtitle=args.subtitle,
         client=args.client,
-        article_file=args.article
+        article_file=args.article,
+        output=output
     )
     
     print(f"🎯 Generated: {output_path}")